@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import cProfile
+import pstats
+import sys
+from pathlib import Path
+
+from specleft.parser import SpecParser
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_SPECS_DIR = REPO_ROOT / "features"
+
+
+def _parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Profile SpecParser.parse_directory over a specs corpus."
+    )
+    parser.add_argument(
+        "specs_dir",
+        nargs="?",
+        type=Path,
+        default=DEFAULT_SPECS_DIR,
+        help="Specs directory to parse (default: the repository's features/).",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=50,
+        help="Number of parse passes to profile (default: 50).",
+    )
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=25,
+        help="Number of functions to print, by cumulative time (default: 25).",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        help="Also write raw profile data here (for snakeviz or pstats).",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(sys.argv[1:] if argv is None else argv)
+    if not args.specs_dir.is_dir():
+        print(f"Specs directory not found: {args.specs_dir}", file=sys.stderr)
+        return 1
+
+    spec_parser = SpecParser()
+    # Warm imports and template pattern caches outside the profiled region.
+    spec_parser.parse_directory(args.specs_dir)
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    for _ in range(args.repeat):
+        spec_parser.parse_directory(args.specs_dir)
+    profiler.disable()
+
+    if args.output:
+        profiler.dump_stats(args.output)
+
+    stats = pstats.Stats(profiler)
+    stats.strip_dirs().sort_stats(pstats.SortKey.CUMULATIVE).print_stats(args.limit)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -10,12 +10,15 @@ from __future__ import annotations
 
 import functools
 import inspect
+import re
+import string
 import threading
-from collections.abc import AsyncGenerator, Callable, Generator
-from contextlib import asynccontextmanager, contextmanager
+from collections.abc import Callable
+from contextlib import AsyncContextDecorator, ContextDecorator
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, TypedDict, TypeVar, cast
+from types import TracebackType
+from typing import Any, Literal, TypedDict, TypeVar, cast
 
 F = TypeVar("F", bound=Callable[..., Any])
 
@@ -101,6 +104,231 @@ def is_in_specleft_test() -> bool:
     return bool(_get_context().get("in_specleft_test", False))
 
 
+def _make_sync_wrapper(
+    func: Callable[..., Any], feature_id: str, scenario_id: str
+) -> Callable[..., Any]:
+    """Build the call wrapper for a synchronous @specleft test."""
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        _reset_context()
+        ctx = _get_context()
+        ctx["feature_id"] = feature_id
+        ctx["scenario_id"] = scenario_id
+        ctx["in_specleft_test"] = True
+        try:
+            return func(*args, **kwargs)
+        finally:
+            ctx["in_specleft_test"] = False
+
+    return wrapper
+
+
+def _make_async_wrapper(
+    func: Callable[..., Any], feature_id: str, scenario_id: str
+) -> Callable[..., Any]:
+    """Build the call wrapper for an async @specleft test."""
+
+    @functools.wraps(func)
+    async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+        _reset_context()
+        ctx = _get_context()
+        ctx["feature_id"] = feature_id
+        ctx["scenario_id"] = scenario_id
+        ctx["in_specleft_test"] = True
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            ctx["in_specleft_test"] = False
+
+    return async_wrapper
+
+
+class _BaseStepContext:
+    """Shared bookkeeping for the sync and async step context managers."""
+
+    def __init__(self, description: str, skip: bool, reason: str | None) -> None:
+        self._description = description
+        self._skip = skip
+        self._reason = reason
+
+    def _start(self) -> None:
+        self._ctx = _get_context()
+        if self._skip:
+            # Skipped steps are recorded in full on entry; _finish is a no-op.
+            now = datetime.now()
+            self._ctx["steps"].append(
+                StepResult(
+                    description=self._description,
+                    status="skipped",
+                    start_time=now,
+                    end_time=now,
+                    skipped_reason=self._reason or "Step marked as skip",
+                )
+            )
+            return
+        self._start_time = datetime.now()
+
+    def _finish(
+        self, exc_type: type[BaseException] | None, exc: BaseException | None
+    ) -> None:
+        if self._skip:
+            return
+
+        end_time = datetime.now()
+        if exc_type is None:
+            self._ctx["steps"].append(
+                StepResult(self._description, "passed", self._start_time, end_time)
+            )
+            return
+
+        # Only regular exceptions fail a step; e.g. KeyboardInterrupt does not.
+        failed = issubclass(exc_type, Exception)
+        self._ctx["steps"].append(
+            StepResult(
+                description=self._description,
+                status="failed" if failed else "passed",
+                start_time=self._start_time,
+                end_time=end_time,
+                error=str(exc) if failed else None,
+            )
+        )
+
+
+class _StepContext(_BaseStepContext, ContextDecorator):
+    """Context manager that records a single step result on exit.
+
+    Also usable as a decorator, recording one step per call.
+    """
+
+    def _recreate_cm(self) -> _StepContext:
+        # Entry state lives on the instance, so each decorated call needs its own.
+        return _StepContext(self._description, self._skip, self._reason)
+
+    def __enter__(self) -> None:
+        self._start()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> Literal[False]:
+        self._finish(exc_type, exc)
+        return False
+
+
+class _AsyncStepContext(_BaseStepContext, AsyncContextDecorator):
+    """Async context manager that records a single step result on exit.
+
+    Also usable as a decorator on coroutine functions, one step per call.
+    """
+
+    def _recreate_cm(self) -> _AsyncStepContext:
+        return _AsyncStepContext(self._description, self._skip, self._reason)
+
+    async def __aenter__(self) -> None:
+        self._start()
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> Literal[False]:
+        self._finish(exc_type, exc)
+        return False
+
+
+# Start of attribute or index access in a replacement field name.
+_FIELD_ACCESS = re.compile(r"[.\[]")
+
+
+class _KeepMissing(dict[str, Any]):
+    """Format mapping that leaves unknown plain placeholders untouched."""
+
+    def __missing__(self, key: str) -> str:
+        return "{" + key + "}"
+
+
+class _StepDescription:
+    """shared_step description template, parsed once at decoration time."""
+
+    __slots__ = ("_template", "_signature", "_segments", "_strict_roots", "_static")
+
+    def __init__(self, template: str, func: Callable[..., Any]) -> None:
+        self._template = template
+        self._signature: inspect.Signature | None
+        try:
+            self._signature = inspect.signature(func)
+        except (TypeError, ValueError):
+            # e.g. builtins without introspectable signatures; render falls back.
+            self._signature = None
+        self._segments, self._strict_roots = self._parse(template)
+        # Templates without fields render the same on every call.
+        self._static: str | None = None
+        if self._segments is not None and all(
+            field is None for _, field in self._segments
+        ):
+            self._static = "".join(literal for literal, _ in self._segments)
+
+    @staticmethod
+    def _parse(
+        template: str,
+    ) -> tuple[list[tuple[str, str | None]] | None, frozenset[str]]:
+        """Split into (literal, field) pairs, or None for templates that need
+        full str.format handling (conversions, format specs, indexing).
+
+        Also returns the argument names those full-handling fields read; the
+        template is only rendered when all of them are bound.
+        """
+        try:
+            parsed = list(string.Formatter().parse(template))
+        except ValueError:
+            return None, frozenset()
+        segments: list[tuple[str, str | None]] | None = []
+        strict_roots: set[str] = set()
+        for literal, field_name, format_spec, conversion in parsed:
+            if field_name is None:
+                if segments is not None:
+                    segments.append((literal, None))
+                continue
+            if format_spec or conversion or not field_name.isidentifier():
+                segments = None
+                strict_roots.add(_FIELD_ACCESS.split(field_name, maxsplit=1)[0])
+            elif segments is not None:
+                segments.append((literal, field_name))
+        return segments, frozenset(strict_roots)
+
+    def render(self, args: tuple[Any, ...], kwargs: dict[str, Any]) -> str:
+        """Interpolate call arguments into the description."""
+        if self._static is not None:
+            return self._static
+        if self._signature is None:
+            return self._template
+        segments = self._segments
+        try:
+            bound = self._signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = bound.arguments
+            if segments is None:
+                if not self._strict_roots.issubset(arguments):
+                    return self._template
+                return self._template.format_map(_KeepMissing(arguments))
+            parts: list[str] = []
+            for literal, field in segments:
+                parts.append(literal)
+                if field is not None:
+                    parts.append(
+                        format(arguments[field])
+                        if field in arguments
+                        else "{" + field + "}"
+                    )
+            return "".join(parts)
+        except (AttributeError, KeyError, IndexError, ValueError, TypeError):
+            return self._template
+
+
 class SpecleftDecorator:
     """Main decorator class for marking tests with SpecLeft metadata."""
 
@@ -112,43 +340,22 @@ class SpecleftDecorator:
         reason: str | None = None,
     ) -> Callable[[F], F]:
         def decorator(func: F) -> F:
-            func._specleft_feature_id = feature_id  # type: ignore[attr-defined]
-            func._specleft_scenario_id = scenario_id  # type: ignore[attr-defined]
-
-            # Check if the function is async and create appropriate wrapper
+            # Pick the wrapper once at decoration time so calls never re-check
+            wrapper_func: Any
             if inspect.iscoroutinefunction(func):
-
-                @functools.wraps(func)
-                async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
-                    _reset_context()
-                    ctx = _get_context()
-                    ctx["feature_id"] = feature_id
-                    ctx["scenario_id"] = scenario_id
-                    ctx["in_specleft_test"] = True
-                    try:
-                        return await func(*args, **kwargs)
-                    finally:
-                        ctx["in_specleft_test"] = False
-
-                wrapper_func: Any = async_wrapper
+                wrapper_func = _make_async_wrapper(func, feature_id, scenario_id)
             else:
-
-                @functools.wraps(func)
-                def wrapper(*args: Any, **kwargs: Any) -> Any:
-                    _reset_context()
-                    ctx = _get_context()
-                    ctx["feature_id"] = feature_id
-                    ctx["scenario_id"] = scenario_id
-                    ctx["in_specleft_test"] = True
-                    try:
-                        return func(*args, **kwargs)
-                    finally:
-                        ctx["in_specleft_test"] = False
-
-                wrapper_func = wrapper
+                wrapper_func = _make_sync_wrapper(func, feature_id, scenario_id)
+            wrapper_func.__dict__.update(
+                {
+                    "_specleft_feature_id": feature_id,
+                    "_specleft_scenario_id": scenario_id,
+                }
+            )
 
             if skip:
                 skip_reason = reason or "SpecLeft test skipped"
+                # Imported lazily so importing specleft outside pytest stays cheap.
                 import pytest
 
                 return cast(F, pytest.mark.skip(reason=skip_reason)(wrapper_func))
@@ -158,135 +365,101 @@ class SpecleftDecorator:
         return decorator
 
     @staticmethod
-    @contextmanager
     def step(
         description: str,
         skip: bool = False,
         reason: str | None = None,
-    ) -> Generator[None, None, None]:
+    ) -> _StepContext:
         """Context manager for test steps."""
-        ctx = _get_context()
-        step_result = StepResult(description=description, start_time=datetime.now())
-
-        if skip:
-            step_result.status = "skipped"
-            step_result.skipped_reason = reason or "Step marked as skip"
-            step_result.end_time = datetime.now()
-            ctx["steps"].append(step_result)
-            yield
-            return
-
-        try:
-            yield
-            step_result.status = "passed"
-        except Exception as exc:
-            step_result.status = "failed"
-            step_result.error = str(exc)
-            raise
-        finally:
-            step_result.end_time = datetime.now()
-            ctx["steps"].append(step_result)
+        return _StepContext(description, skip, reason)
 
     @staticmethod
-    @asynccontextmanager
-    async def async_step(
+    def async_step(
         description: str,
         skip: bool = False,
         reason: str | None = None,
-    ) -> AsyncGenerator[None, None]:
+    ) -> _AsyncStepContext:
         """Async context manager for test steps that need to await."""
-        ctx = _get_context()
-        step_result = StepResult(description=description, start_time=datetime.now())
-
-        if skip:
-            step_result.status = "skipped"
-            step_result.skipped_reason = reason or "Step marked as skip"
-            step_result.end_time = datetime.now()
-            ctx["steps"].append(step_result)
-            yield
-            return
-
-        try:
-            yield
-            step_result.status = "passed"
-        except Exception as exc:
-            step_result.status = "failed"
-            step_result.error = str(exc)
-            raise
-        finally:
-            step_result.end_time = datetime.now()
-            ctx["steps"].append(step_result)
+        return _AsyncStepContext(description, skip, reason)
 
     @staticmethod
     def shared_step(description: str) -> Callable[[F], F]:
         """Decorator for creating shared step functions."""
 
         def decorator(func: F) -> F:
+            step_description = _StepDescription(description, func)
+
             # Check if the function is async and create appropriate wrapper
             if inspect.iscoroutinefunction(func):
 
                 @functools.wraps(func)
                 async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
-                    try:
-                        sig = inspect.signature(func)
-                        bound = sig.bind(*args, **kwargs)
-                        bound.apply_defaults()
-                        formatted_desc = description.format(**bound.arguments)
-                    except (KeyError, IndexError, ValueError, TypeError):
-                        formatted_desc = description
+                    formatted_desc = step_description.render(args, kwargs)
 
                     ctx = _get_context()
-                    step_result = StepResult(
-                        description=formatted_desc, start_time=datetime.now()
-                    )
+                    start_time = datetime.now()
+                    status = "passed"
+                    error: str | None = None
 
                     try:
-                        result = await func(*args, **kwargs)
-                        step_result.status = "passed"
-                        return result
+                        return await func(*args, **kwargs)
                     except Exception as exc:
-                        step_result.status = "failed"
-                        step_result.error = str(exc)
+                        status = "failed"
+                        error = str(exc)
                         raise
                     finally:
-                        step_result.end_time = datetime.now()
-                        ctx["steps"].append(step_result)
-
-                async_wrapper._specleft_reusable_step = True  # type: ignore[attr-defined]
-                async_wrapper._specleft_step_description = description  # type: ignore[attr-defined]
+                        ctx["steps"].append(
+                            StepResult(
+                                formatted_desc,
+                                status,
+                                start_time,
+                                datetime.now(),
+                                error,
+                            )
+                        )
+
+                async_wrapper.__dict__.update(
+                    {
+                        "_specleft_reusable_step": True,
+                        "_specleft_step_description": description,
+                    }
+                )
                 return async_wrapper  # type: ignore[return-value]
 
             else:
 
                 @functools.wraps(func)
                 def wrapper(*args: Any, **kwargs: Any) -> Any:
-                    try:
-                        sig = inspect.signature(func)
-                        bound = sig.bind(*args, **kwargs)
-                        bound.apply_defaults()
-                        formatted_desc = description.format(**bound.arguments)
-                    except (KeyError, IndexError, ValueError, TypeError):
-                        formatted_desc = description
+                    formatted_desc = step_description.render(args, kwargs)
 
                     ctx = _get_context()
-                    step_result = StepResult(
-                        description=formatted_desc, start_time=datetime.now()
-                    )
+                    start_time = datetime.now()
+                    status = "passed"
+                    error: str | None = None
 
                     try:
-                        result = func(*args, **kwargs)
-                        step_result.status = "passed"
-                        return result
+                        return func(*args, **kwargs)
                     except Exception as exc:
-                        step_result.status = "failed"
-                        step_result.error = str(exc)
+                        status = "failed"
+                        error = str(exc)
                         raise
                     finally:
-                        step_result.end_time = datetime.now()
-                        ctx["steps"].append(step_result)
-
-                wrapper._specleft_reusable_step = True  # type: ignore[attr-defined]
-                wrapper._specleft_step_description = description  # type: ignore[attr-defined]
+                        ctx["steps"].append(
+                            StepResult(
+                                formatted_desc,
+                                status,
+                                start_time,
+                                datetime.now(),
+                                error,
+                            )
+                        )
+
+                wrapper.__dict__.update(
+                    {
+                        "_specleft_reusable_step": True,
+                        "_specleft_step_description": description,
+                    }
+                )
                 return wrapper  # type: ignore[return-value]
 
         return decorator
@@ -43,6 +43,22 @@ class SpecParser:
         r"^\s*[-*]\s+\*\*(Given|When|Then|And|But)\*\*\s+(.+)$",
         re.IGNORECASE | re.MULTILINE,
     )
+    SCENARIO_STEP_PATTERN = re.compile(
+        r"^\s*[-*]\s+(?:\*\*)?(Given|When|Then|And|But)(?:\*\*)?\s+(.+)$"
+    )
+    TITLE_PATTERN = re.compile(
+        r"^#\s+(?:Scenario:|Story:|Feature:)?\s*(.+)$", re.MULTILINE
+    )
+    H1_PATTERN = re.compile(r"^#\s+(.+)$", re.MULTILINE)
+    SCENARIO_HEADING_PATTERN = re.compile(r"^###\s+Scenario:\s*(.+)$", re.MULTILINE)
+    SCENARIO_START_PATTERN = re.compile(r"^###\s+Scenario:", re.MULTILINE)
+    PRIORITY_LINE_PATTERN = re.compile(r"^priority:\s*([\w-]+)$", re.MULTILINE)
+    STEPS_SECTION_PATTERN = re.compile(r"## Steps\s*\n(.*?)(?=\n##|\Z)", re.DOTALL)
+    TEST_DATA_SECTION_PATTERN = re.compile(
+        r"## Test Data\s*\n(.*?)(?=\n##|\Z)", re.DOTALL
+    )
+    INLINE_CODE_PATTERN = re.compile(r"`([^`]+)`")
+    METADATA_BLOCK_PATTERN = re.compile(r"\n---\s*\n([\s\S]+?)\n---\s*$")
 
     def __init__(self, template: PRDTemplate | None = None) -> None:
         self._template = template or default_template()
@@ -226,11 +242,7 @@ class SpecParser:
 
     def _extract_title(self, content: str) -> str | None:
         """Extract the first H1 title from Markdown content."""
-        match = re.search(
-            r"^#\s+(?:Scenario:|Story:|Feature:)?\s*(.+)$",
-            content,
-            re.MULTILINE,
-        )
+        match = self.TITLE_PATTERN.search(content)
         return match.group(1).strip() if match else None
 
     def _extract_description(self, content: str) -> str | None:
@@ -261,14 +273,14 @@ class SpecParser:
         """Parse Gherkin steps from Markdown content."""
         steps: list[SpecStep] = []
 
-        steps_match = re.search(r"## Steps\s*\n(.*?)(?=\n##|\Z)", content, re.DOTALL)
+        steps_match = self.STEPS_SECTION_PATTERN.search(content)
         if not steps_match:
             return steps
 
         for match in self.STEP_PATTERN.finditer(steps_match.group(1)):
             step_type = match.group(1).lower()
             description = match.group(2).strip()
-            description = re.sub(r"`([^`]+)`", r"\1", description)
+            description = self._strip_inline_code(description)
 
             steps.append(SpecStep(type=StepType(step_type), description=description))
 
@@ -278,7 +290,7 @@ class SpecParser:
         """Parse test data table from Markdown content."""
         test_data: list[SpecDataRow] = []
 
-        data_match = re.search(r"## Test Data\s*\n(.*?)(?=\n##|\Z)", content, re.DOTALL)
+        data_match = self.TEST_DATA_SECTION_PATTERN.search(content)
         if not data_match:
             return test_data
 
@@ -320,10 +332,10 @@ class SpecParser:
         self, content: str, source_file: Path
     ) -> list[ScenarioSpec]:
         scenarios: list[ScenarioSpec] = []
-        for match in re.finditer(r"^###\s+Scenario:\s*(.+)$", content, re.MULTILINE):
+        for match in self.SCENARIO_HEADING_PATTERN.finditer(content):
             title = match.group(1).strip()
             block = content[match.end() :]
-            next_header = re.search(r"^###\s+Scenario:", block, re.MULTILINE)
+            next_header = self.SCENARIO_START_PATTERN.search(block)
             if next_header:
                 block = block[: next_header.start()]
             scenarios.append(self._parse_scenario_block(title, block, source_file))
@@ -357,7 +369,7 @@ class SpecParser:
         using the raw H1 text so that files produced by ``specleft plan``
         (which may omit the ``Feature:`` prefix) are still parsed.
         """
-        h1_match = re.search(r"^#\s+(.+)$", content, re.MULTILINE)
+        h1_match = self.H1_PATTERN.search(content)
         if not h1_match:
             return None
 
@@ -392,22 +404,29 @@ class SpecParser:
         return " ".join(description_lines) if description_lines else None
 
     def _extract_scenario_priority(self, block: str) -> str | None:
-        match = re.search(r"^priority:\s*([\w-]+)$", block, re.MULTILINE)
+        match = self.PRIORITY_LINE_PATTERN.search(block)
         return match.group(1).strip() if match else None
 
     def _extract_scenario_steps(self, block: str) -> list[SpecStep]:
         steps: list[SpecStep] = []
         for line in block.splitlines():
-            match = re.match(
-                r"^\s*[-*]\s+(?:\*\*)?(Given|When|Then|And|But)(?:\*\*)?\s+(.+)$", line
-            )
+            # Only list items can be steps; skip other lines without a regex.
+            if line.lstrip()[:1] not in ("-", "*"):
+                continue
+            match = self.SCENARIO_STEP_PATTERN.match(line)
             if not match:
                 continue
             step_type = match.group(1).lower()
-            description = re.sub(r"`([^`]+)`", r"\1", match.group(2).strip())
+            description = self._strip_inline_code(match.group(2).strip())
             steps.append(SpecStep(type=StepType(step_type), description=description))
         return steps
 
+    def _strip_inline_code(self, text: str) -> str:
+        """Remove backtick delimiters around inline code spans."""
+        if "`" not in text:
+            return text
+        return self.INLINE_CODE_PATTERN.sub(r"\1", text)
+
     def _extract_scenario_description(self, block: str) -> str | None:
         for line in block.splitlines():
             if line.strip().startswith("-"):
@@ -419,7 +438,7 @@ class SpecParser:
         return None
 
     def _split_metadata_block(self, content: str) -> tuple[str, dict[str, Any]]:
-        match = re.search(r"\n---\s*\n([\s\S]+?)\n---\s*$", content)
+        match = self.METADATA_BLOCK_PATTERN.search(content)
         if not match:
             return content, {}
         raw = match.group(0)
@@ -5,6 +5,7 @@
 
 from __future__ import annotations
 
+import functools
 import re
 from pathlib import Path
 
@@ -100,6 +101,9 @@ def _validate_match_mode(mode: str) -> None:
         raise ValueError("Match mode must be one of: any, all, patterns, contains")
 
 
+_PLACEHOLDER_PATTERN = re.compile(r"{([^}]+)}")
+
+
 def _literal_to_regex(text: str) -> str:
     parts: list[str] = []
     in_whitespace = False
@@ -114,10 +118,14 @@ def _literal_to_regex(text: str) -> str:
     return "".join(parts)
 
 
+@functools.lru_cache(maxsize=256)
 def compile_pattern(pattern: str) -> re.Pattern[str]:
-    """Compile a template pattern into a regex with named groups."""
-    placeholder_regex = re.compile(r"{([^}]+)}")
-    placeholders = list(placeholder_regex.finditer(pattern))
+    """Compile a template pattern into a regex with named groups.
+
+    Results are cached: parsers and the plan command recompile the same
+    template patterns on every construction.
+    """
+    placeholders = list(_PLACEHOLDER_PATTERN.finditer(pattern))
     if not placeholders:
         raise ValueError("Pattern must include {title} or {value}")
 
@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 import json
-import hashlib
 from pathlib import Path
 
 from click.testing import CliRunner
 from specleft.cli.main import cli
 
+from tests.helpers.filesystem import file_sha256
+
 
 class TestInitCommand:
     """Tests for 'specleft init' command."""
@@ -24,10 +25,7 @@ class TestInitCommand:
             assert checksum_path.exists()
             assert Path(".specleft/specs/example-feature.md").exists()
             assert Path(".specleft/templates/prd-template.yml").exists()
-            expected_hash = hashlib.sha256(
-                skill_path.read_text().encode("utf-8")
-            ).hexdigest()
-            assert checksum_path.read_text().strip() == expected_hash
+            assert checksum_path.read_text().strip() == file_sha256(skill_path)
 
     def test_init_json_dry_run(self) -> None:
         runner = CliRunner()
@@ -0,0 +1,12 @@
+"""Pytest configuration for decorator tests."""
+
+from __future__ import annotations
+
+import pytest
+from specleft.decorators import _reset_context
+
+
+@pytest.fixture(autouse=True)
+def reset_step_context() -> None:
+    """Start every decorator test with empty steps and no test metadata."""
+    _reset_context()
@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
 import concurrent.futures
+import dataclasses
 import importlib
+import subprocess
+import sys
 import threading
 import time
 from datetime import datetime
@@ -15,6 +19,7 @@ from specleft.decorators import (
     StepResult,
     _get_context,
     _reset_context,
+    async_step,
     clear_steps,
     get_current_metadata,
     get_current_steps,
@@ -57,6 +62,20 @@ class TestStepResult:
         assert result.error == "Something went wrong"
         assert result.skipped_reason == "Not needed"
 
+    def test_step_result_defaults_start_time(self) -> None:
+        """Test StepResult fills in start_time when omitted."""
+        before = datetime.now()
+        result = StepResult(description="Test")
+        assert result.start_time >= before
+
+    def test_step_result_is_a_mutable_dataclass(self) -> None:
+        """Test StepResult keeps its dataclass API."""
+        result = StepResult(description="Test", start_time=datetime.now())
+        result.status = "failed"
+        assert dataclasses.asdict(result)["status"] == "failed"
+        assert dataclasses.replace(result, status="passed").status == "passed"
+        assert result != dataclasses.astuple(result)
+
     def test_duration_returns_zero_without_end_time(self) -> None:
         """Test duration property when end_time is missing."""
         result = StepResult(description="Test", start_time=datetime.now())
@@ -72,12 +91,6 @@ class TestStepResult:
 class TestContextHelpers:
     """Tests for context helper functions."""
 
-    def setup_method(self) -> None:
-        clear_steps()
-        _get_context()["feature_id"] = None
-        _get_context()["scenario_id"] = None
-        _get_context()["in_specleft_test"] = False
-
     def test_clear_steps(self) -> None:
         """Test that clear_steps resets the steps list."""
         _get_context()["steps"] = [
@@ -257,9 +270,6 @@ class TestSpecleftDecorator:
 class TestStepContextManager:
     """Tests for specleft.step() context manager."""
 
-    def setup_method(self) -> None:
-        clear_steps()
-
     def test_step_records_description(self) -> None:
         """Test that step records the description."""
         with step("Given user is logged in"):
@@ -347,14 +357,26 @@ class TestStepContextManager:
         assert steps[0].status == "skipped"
         assert steps[0].skipped_reason == "Step marked as skip"
 
+    def test_step_as_decorator_records_each_call(self) -> None:
+        """Test that step() decorates helpers, recording one step per call."""
+
+        @step("Given a helper runs")
+        def helper(depth: int) -> int:
+            time.sleep(0.001)
+            return helper(depth - 1) + 1 if depth else 0
+
+        assert helper(1) == 1
+
+        steps = get_current_steps()
+        assert [s.description for s in steps] == ["Given a helper runs"] * 2
+        assert all(s.status == "passed" for s in steps)
+        inner, outer = steps
+        assert outer.start_time < inner.start_time
+
 
 class TestReusableStepDecorator:
     """Tests for @shared_step decorator."""
 
-    def setup_method(self) -> None:
-        clear_steps()
-        _get_context()["in_specleft_test"] = False
-
     def test_reusable_step_stores_description(self) -> None:
         """Test that shared_step stores description on function."""
 
@@ -362,7 +384,6 @@ class TestReusableStepDecorator:
         def user_action() -> None:
             pass
 
-        assert hasattr(user_action, "_specleft_step_description")
         assert user_action._specleft_step_description == "User performs action"
 
     def test_reusable_step_traced_inside_specleft_test(self) -> None:
@@ -448,6 +469,143 @@ class TestReusableStepDecorator:
         steps = get_current_steps()
         assert steps[0].description == "User does {nonexistent_param}"
 
+    def test_reusable_step_partial_interpolation_keeps_unknown(self) -> None:
+        """Test that known parameters interpolate alongside unknown placeholders."""
+
+        @shared_step("User {name} does {nonexistent_param}")
+        def do_action(name: str) -> None:
+            pass
+
+        @specleft(feature_id="TEST-001", scenario_id="partial")
+        def test_action() -> None:
+            do_action("alice")
+
+        test_action()
+
+        steps = get_current_steps()
+        assert steps[0].description == "User alice does {nonexistent_param}"
+
+    @pytest.mark.parametrize(
+        "template",
+        ["Load {data[absent]}", "Load {data[0]}", "Load {data.absent}"],
+    )
+    def test_reusable_step_unresolved_index_uses_original(self, template: str) -> None:
+        """Test that failed index or attribute lookups fall back to the template."""
+
+        @shared_step(template)
+        def load(data: dict[str, int]) -> None:
+            pass
+
+        @specleft(feature_id="TEST-005", scenario_id="indexed")
+        def test_action() -> None:
+            load({"present": 1})
+
+        test_action()
+
+        steps = get_current_steps()
+        assert steps[0].description == template
+
+    @pytest.mark.parametrize("template", ["Show {missing!r}", "Pad {missing:>10}"])
+    def test_reusable_step_missing_field_with_spec_uses_original(
+        self, template: str
+    ) -> None:
+        """Test that a missing field with a conversion or spec is not formatted."""
+
+        @shared_step(template)
+        def show(value: str) -> None:
+            pass
+
+        @specleft(feature_id="TEST-005", scenario_id="missing-spec")
+        def test_action() -> None:
+            show("x")
+
+        test_action()
+
+        steps = get_current_steps()
+        assert steps[0].description == template
+
+    def test_reusable_step_builtin_without_signature(self) -> None:
+        """Test that functions without a signature decorate and fall back."""
+        pick = shared_step("Pick {x}")(min)
+
+        @specleft(feature_id="TEST-005", scenario_id="builtin")
+        def test_action() -> int:
+            return cast(int, pick(3, 1))
+
+        assert test_action() == 1
+
+        steps = get_current_steps()
+        assert steps[0].description == "Pick {x}"
+
+    @pytest.mark.parametrize(
+        "template",
+        [
+            "Use {{literal}} braces",
+            "Show {value} and {value!r}",
+            "Pad {value:>6}|",
+            "Read {data[key]} and {data.__class__.__name__}",
+            "Read {data[absent]}",
+            "Show {missing!r}",
+            "Pad {missing:>10}",
+            "Pad {value:{missing}}",
+            "Positional {}",
+            "Unbalanced {",
+        ],
+    )
+    def test_reusable_step_matches_str_format(self, template: str) -> None:
+        """Test rendering matches str.format, falling back to the template."""
+
+        def baseline(value: str, data: dict[str, int]) -> str:
+            try:
+                return template.format(value=value, data=data)
+            except (KeyError, IndexError, ValueError, TypeError):
+                return template
+
+        @shared_step(template)
+        def act(value: str, data: dict[str, int]) -> None:
+            pass
+
+        @specleft(feature_id="TEST-005", scenario_id="str-format-parity")
+        def test_action() -> None:
+            act("x", data={"key": 1})
+
+        test_action()
+
+        steps = get_current_steps()
+        assert steps[0].description == baseline("x", {"key": 1})
+
+    def test_reusable_step_format_spec_and_escaped_braces(self) -> None:
+        """Test format specs and escaped braces render like str.format."""
+
+        @shared_step("Charge {amount:.2f} for {{order}} {order_id}")
+        def charge(amount: float, order_id: int) -> None:
+            pass
+
+        @specleft(feature_id="TEST-004", scenario_id="format-spec")
+        def test_action() -> None:
+            charge(3.5, order_id=7)
+
+        test_action()
+
+        steps = get_current_steps()
+        assert steps[0].description == "Charge 3.50 for {order} 7"
+
+    def test_reusable_step_escaped_braces_without_fields(self) -> None:
+        """Test escaped braces render when the template has no fields."""
+
+        @shared_step("Use {{literal}} braces")
+        def use_braces() -> None:
+            pass
+
+        @specleft(feature_id="TEST-004", scenario_id="escaped-braces")
+        def test_action() -> None:
+            use_braces()
+
+        test_action()
+
+        steps = get_current_steps()
+        assert steps[0].description == "Use {literal} braces"
+
     def test_reusable_step_no_args_fallback(self) -> None:
         """Test shared_step fallback when no parameters are provided."""
 
@@ -512,6 +670,20 @@ class TestContextInitialization:
         assert module.step
         assert module.shared_step
 
+    def test_module_import_does_not_import_pytest(self) -> None:
+        """Test importing decorators leaves pytest unloaded until skip is used."""
+        code = (
+            "import sys\n"
+            "from specleft.decorators import specleft\n"
+            "assert 'pytest' not in sys.modules\n"
+            "specleft(feature_id='F', scenario_id='s', skip=True)(lambda: None)\n"
+            "assert 'pytest' in sys.modules\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, timeout=30
+        )
+        assert result.returncode == 0, result.stderr
+
     def test_reusable_step_preserves_function_name(self) -> None:
         """Test that shared_step preserves original function name."""
 
@@ -638,9 +810,6 @@ class TestThreadSafety:
 class TestCombinedUsage:
     """Tests for combined usage of decorators and context managers."""
 
-    def setup_method(self) -> None:
-        clear_steps()
-
     def test_manual_and_reusable_steps_together(self) -> None:
         """Test mixing manual step() with shared_step()."""
 
@@ -692,12 +861,6 @@ class TestCombinedUsage:
 class TestAsyncSpecleftDecorator:
     """Tests for @specleft decorator with async functions."""
 
-    def setup_method(self) -> None:
-        clear_steps()
-        _get_context()["feature_id"] = None
-        _get_context()["scenario_id"] = None
-        _get_context()["in_specleft_test"] = False
-
     async def test_async_decorator_stores_feature_id(self) -> None:
         """Test that decorator stores feature_id on async function."""
 
@@ -786,8 +949,6 @@ class TestAsyncSpecleftDecorator:
 
     async def test_async_decorator_with_await(self) -> None:
         """Test that async decorator properly awaits the function."""
-        import asyncio
-
         call_order: list[str] = []
 
         @specleft(feature_id="ASYNC-001", scenario_id="async-await")
@@ -822,13 +983,8 @@ class TestAsyncSpecleftDecorator:
 class TestAsyncStepContextManager:
     """Tests for specleft.async_step() async context manager."""
 
-    def setup_method(self) -> None:
-        clear_steps()
-
     async def test_async_step_records_description(self) -> None:
         """Test that async_step records the description."""
-        from specleft.decorators import async_step
-
         async with async_step("Given user is logged in async"):
             pass
 
@@ -838,8 +994,6 @@ class TestAsyncStepContextManager:
 
     async def test_async_step_records_passed_status(self) -> None:
         """Test that successful async_step has passed status."""
-        from specleft.decorators import async_step
-
         async with async_step("Successful async step"):
             pass
 
@@ -848,8 +1002,6 @@ class TestAsyncStepContextManager:
 
     async def test_async_step_records_failed_status_on_exception(self) -> None:
         """Test that async_step with exception has failed status."""
-        from specleft.decorators import async_step
-
         with pytest.raises(ValueError):
             async with async_step("Failing async step"):
                 raise ValueError("Async test error")
@@ -860,10 +1012,6 @@ class TestAsyncStepContextManager:
 
     async def test_async_step_allows_await(self) -> None:
         """Test that async_step allows await inside the block."""
-        import asyncio
-
-        from specleft.decorators import async_step
-
         result = None
         async with async_step("Step with await"):
             await asyncio.sleep(0.01)
@@ -876,10 +1024,6 @@ class TestAsyncStepContextManager:
 
     async def test_async_step_records_timing(self) -> None:
         """Test that async_step records start and end times."""
-        import asyncio
-
-        from specleft.decorators import async_step
-
         async with async_step("Timed async step"):
             await asyncio.sleep(0.01)
 
@@ -891,8 +1035,6 @@ class TestAsyncStepContextManager:
 
     async def test_async_step_skip_records_result(self) -> None:
         """Test that skipped async steps are recorded."""
-        from specleft.decorators import async_step
-
         async with async_step("Skipped async step", skip=True, reason="Not needed"):
             pass
 
@@ -900,11 +1042,10 @@ class TestAsyncStepContextManager:
         assert len(steps) == 1
         assert steps[0].status == "skipped"
         assert steps[0].skipped_reason == "Not needed"
+        assert steps[0].duration == 0.0
 
     async def test_multiple_async_steps_recorded_in_order(self) -> None:
         """Test that multiple async steps are recorded in execution order."""
-        from specleft.decorators import async_step
-
         async with async_step("Async Step 1"):
             pass
         async with async_step("Async Step 2"):
@@ -918,14 +1059,26 @@ class TestAsyncStepContextManager:
         assert steps[1].description == "Async Step 2"
         assert steps[2].description == "Async Step 3"
 
+    async def test_async_step_as_decorator_records_each_call(self) -> None:
+        """Test that async_step() decorates coroutines, one step per call."""
+
+        @async_step("Given an async helper runs")
+        async def helper(depth: int) -> int:
+            await asyncio.sleep(0.001)
+            return await helper(depth - 1) + 1 if depth else 0
+
+        assert await helper(1) == 1
+
+        steps = get_current_steps()
+        assert [s.description for s in steps] == ["Given an async helper runs"] * 2
+        assert all(s.status == "passed" for s in steps)
+        inner, outer = steps
+        assert outer.start_time < inner.start_time
+
 
 class TestAsyncSharedStep:
     """Tests for @shared_step decorator with async functions."""
 
-    def setup_method(self) -> None:
-        clear_steps()
-        _get_context()["in_specleft_test"] = False
-
     async def test_async_shared_step_stores_description(self) -> None:
         """Test that shared_step stores description on async function."""
 
@@ -933,7 +1086,6 @@ class TestAsyncSharedStep:
         async def user_action() -> None:
             pass
 
-        assert hasattr(user_action, "_specleft_step_description")
         assert user_action._specleft_step_description == "User performs async action"
 
     async def test_async_shared_step_traced_inside_specleft_test(self) -> None:
@@ -973,7 +1125,6 @@ class TestAsyncSharedStep:
 
     async def test_async_shared_step_with_await(self) -> None:
         """Test async shared_step properly awaits internal operations."""
-        import asyncio
 
         @shared_step("Perform async operation")
         async def async_operation() -> str:
@@ -1038,9 +1189,6 @@ class TestAsyncSharedStep:
 class TestMixedSyncAsyncUsage:
     """Tests for combined sync and async usage patterns."""
 
-    def setup_method(self) -> None:
-        clear_steps()
-
     async def test_sync_steps_in_async_test(self) -> None:
         """Test that sync step() works inside async decorated function."""
 
@@ -1075,7 +1223,6 @@ class TestMixedSyncAsyncUsage:
 
     async def test_mixed_sync_and_async_steps(self) -> None:
         """Test mixing sync step(), async_step(), and shared_step."""
-        from specleft.decorators import async_step
 
         @shared_step("Shared step {num}")
         def shared(num: int) -> None:
@@ -2,15 +2,90 @@
 
 from __future__ import annotations
 
-import textwrap
+import hashlib
+import os
+import stat
+from collections.abc import Mapping
 from pathlib import Path
 
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
 
-def write_file(path: Path, content: str) -> None:
-    """Write dedented content to a file.
+
+def write_file(path: str | Path, content: str) -> None:
+    """Write pre-formatted content to a file.
+
+    Encodes once and writes through a raw file descriptor, skipping the
+    buffered text IO layer.
 
     Args:
         path: The file path to write to.
-        content: The content to write (will be dedented and stripped).
+        content: The content to write, already left-aligned.
+    """
+    data = memoryview(content.encode("utf-8"))
+    fd = os.open(path, _WRITE_FLAGS, 0o644)
+    try:
+        while data:
+            data = data[os.write(fd, data) :]
+    finally:
+        os.close(fd)
+
+
+def materialize(root: str | Path, files: Mapping[str, str]) -> None:
+    """Write a tree of files under root.
+
+    Each parent directory is created once, however many files it holds.
+
+    Args:
+        root: The directory the relative paths in files are resolved against.
+        files: Mapping of POSIX-style relative path to file content.
+    """
+    root = os.fspath(root)
+    created: set[str] = set()
+    for relative_path, content in files.items():
+        path = os.path.join(root, *relative_path.split("/"))
+        parent = os.path.dirname(path)
+        if parent not in created:
+            os.makedirs(parent, exist_ok=True)
+            created.add(parent)
+        write_file(path, content)
+
+
+def file_sha256(path: str | Path) -> str:
+    """Return the hex SHA-256 digest of a file's bytes.
+
+    Args:
+        path: The file to hash.
+    """
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+def file_sha256_and_mode(path: str | Path) -> tuple[str, int]:
+    """Return a file's SHA-256 hex digest and permission bits.
+
+    Hashes and stats through the same open descriptor.
+
+    Args:
+        path: The file to inspect.
+    """
+    with open(path, "rb") as handle:
+        digest = hashlib.sha256(handle.read()).hexdigest()
+        return digest, stat.S_IMODE(os.fstat(handle.fileno()).st_mode)
+
+
+def dir_snapshot(root: str | Path) -> frozenset[str]:
+    """Return every path under root, relative to it, as POSIX-style strings.
+
+    Walks with os.walk and joins plain strings rather than building a Path
+    per entry.
+
+    Args:
+        root: The directory to snapshot.
     """
-    path.write_text(textwrap.dedent(content).strip())
+    root = os.fspath(root)
+    entries: list[str] = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        rel_dir = os.path.relpath(dirpath, root)
+        prefix = "" if rel_dir == "." else rel_dir.replace(os.sep, "/") + "/"
+        entries.extend(prefix + name for name in dirnames)
+        entries.extend(prefix + name for name in filenames)
+    return frozenset(entries)
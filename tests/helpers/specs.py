@@ -2,10 +2,137 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 from tests.helpers.filesystem import write_file
 
+_FEATURE_TEMPLATE = """---
+feature_id: {feature_id}
+priority: high
+tags: [core]
+---
+
+# Feature: {title} Feature"""
+
+_STORY_TEMPLATE = """---
+story_id: {story_id}
+tags: [smoke]
+---
+
+# Story: {title} Story"""
+
+_SCENARIO_TEMPLATE = """---
+scenario_id: {scenario_id}
+priority: {priority}
+tags: [smoke]
+execution_time: {execution_time}
+---
+
+# Scenario: {title}
+
+{test_data_block}
+## Steps
+- **Given** a user exists
+- **When** the user logs in
+- **Then** access is granted"""
+
+_TEST_DATA_BLOCK = """
+## Test Data
+| input | expected | description |
+|-------|----------|-------------|
+| a | A | lowercase a |
+| b | B | lowercase b |
+"""
+
+_SINGLE_FILE_FEATURE_TEMPLATE = """# Feature: {feature_title} Feature
+
+## Scenarios
+
+### Scenario: {scenario_title}
+priority: {priority}
+
+- Given a user exists
+- When the user logs in
+- Then access is granted"""
+
+
+_SPECS_TREE_FILES: dict[str, bytes] = {
+    "auth/_feature.md": b"""\
+---
+feature_id: auth
+priority: critical
+tags: [core]
+---
+
+# Feature: User Authentication""",
+    "auth/login/_story.md": b"""\
+---
+story_id: login
+priority: high
+tags: [auth-flow]
+---
+
+# Story: Login""",
+    "auth/login/login_success.md": b"""\
+---
+scenario_id: login-success
+priority: high
+tags: [smoke, critical, auth-flow]
+execution_time: fast
+---
+
+# Scenario: Successful login
+
+## Steps
+- **Given** user has valid credentials
+- **When** user logs in
+- **Then** user sees dashboard""",
+    "auth/login/login_failure.md": b"""\
+---
+scenario_id: login-failure
+priority: medium
+tags: [regression, negative]
+execution_time: fast
+---
+
+# Scenario: Failed login
+
+## Steps
+- **Given** user has invalid credentials
+- **When** user tries to log in
+- **Then** user sees error message""",
+    "parse/_feature.md": b"""\
+---
+feature_id: parse
+priority: high
+tags: [unit]
+---
+
+# Feature: Unit Parsing""",
+    "parse/units/_story.md": b"""\
+---
+story_id: units
+priority: medium
+tags: [parsing]
+---
+
+# Story: Units""",
+    "parse/units/extract_unit.md": b"""\
+---
+scenario_id: extract-unit
+priority: medium
+tags: [unit, parsing]
+execution_time: fast
+---
+
+# Scenario: Extract unit from string
+
+## Steps
+- **When** extracting unit
+- **Then** unit is correct""",
+}
+
 
 def create_feature_specs(
     base_dir: Path,
@@ -38,69 +165,33 @@ def create_feature_specs(
     Returns:
         Path to the specs directory.
     """
-    features_dir = base_dir / Path(features_dir_name)
-    feature_dir = features_dir / feature_id
-    story_dir = feature_dir / story_id
-    story_dir.mkdir(parents=True, exist_ok=True)
+    features_dir = os.path.join(base_dir, features_dir_name)
+    feature_dir = os.path.join(features_dir, feature_id)
+    story_dir = os.path.join(feature_dir, story_id)
+    os.makedirs(story_dir, exist_ok=True)
 
-    scenario_file = story_dir / f"{scenario_id.replace('-', '_')}.md"
+    scenario_file = os.path.join(story_dir, f"{scenario_id.replace('-', '_')}.md")
 
     write_file(
-        feature_dir / "_feature.md",
-        f"""
-        ---
-        feature_id: {feature_id}
-        priority: high
-        tags: [core]
-        ---
-
-        # Feature: {feature_id.title()} Feature
-        """,
+        os.path.join(feature_dir, "_feature.md"),
+        _FEATURE_TEMPLATE.format(feature_id=feature_id, title=feature_id.title()),
     )
-
     write_file(
-        story_dir / "_story.md",
-        f"""
-        ---
-        story_id: {story_id}
-        tags: [smoke]
-        ---
-
-        # Story: {story_id.title()} Story
-        """,
+        os.path.join(story_dir, "_story.md"),
+        _STORY_TEMPLATE.format(story_id=story_id, title=story_id.title()),
     )
-
-    test_data_block = ""
-    if include_test_data:
-        test_data_block = """
-        ## Test Data
-        | input | expected | description |
-        |-------|----------|-------------|
-        | a | A | lowercase a |
-        | b | B | lowercase b |
-        """
-
     write_file(
         scenario_file,
-        f"""
-        ---
-        scenario_id: {scenario_id}
-        priority: {scenario_priority}
-        tags: [smoke]
-        execution_time: {execution_time}
-        ---
-
-        # Scenario: {scenario_id.replace('-', ' ').title()}
-
-        {test_data_block}
-        ## Steps
-        - **Given** a user exists
-        - **When** the user logs in
-        - **Then** access is granted
-        """,
+        _SCENARIO_TEMPLATE.format(
+            scenario_id=scenario_id,
+            priority=scenario_priority,
+            execution_time=execution_time,
+            title=scenario_id.replace("-", " ").title(),
+            test_data_block=_TEST_DATA_BLOCK if include_test_data else "",
+        ),
     )
 
-    return features_dir
+    return Path(features_dir)
 
 
 def create_single_file_feature_spec(
@@ -126,26 +217,19 @@ def create_single_file_feature_spec(
     Returns:
         Path to the specs directory.
     """
-    features_dir = base_dir / Path(features_dir_name)
-    features_dir.mkdir(parents=True, exist_ok=True)
+    features_dir = os.path.join(base_dir, features_dir_name)
+    os.makedirs(features_dir, exist_ok=True)
 
     write_file(
-        features_dir / f"{feature_id}.md",
-        f"""
-        # Feature: {feature_id.title()} Feature
-
-        ## Scenarios
-
-        ### Scenario: {scenario_id.replace('-', ' ').title()}
-        priority: {scenario_priority}
-
-        - Given a user exists
-        - When the user logs in
-        - Then access is granted
-        """,
+        os.path.join(features_dir, f"{feature_id}.md"),
+        _SINGLE_FILE_FEATURE_TEMPLATE.format(
+            feature_title=feature_id.title(),
+            scenario_title=scenario_id.replace("-", " ").title(),
+            priority=scenario_priority,
+        ),
     )
 
-    return features_dir
+    return Path(features_dir)
 
 
 def write_specs_tree(base_dir: Path) -> Path:
@@ -160,91 +244,10 @@ def write_specs_tree(base_dir: Path) -> Path:
         Path to the specs directory.
     """
     features_dir = base_dir / ".specleft" / "specs"
-    auth_story_dir = features_dir / "auth" / "login"
-    parse_story_dir = features_dir / "parse" / "units"
-    auth_story_dir.mkdir(parents=True, exist_ok=True)
-    parse_story_dir.mkdir(parents=True, exist_ok=True)
-
-    (features_dir / "auth" / "_feature.md").write_text("""
----
-feature_id: auth
-priority: critical
-tags: [core]
----
+    (features_dir / "auth" / "login").mkdir(parents=True, exist_ok=True)
+    (features_dir / "parse" / "units").mkdir(parents=True, exist_ok=True)
 
-# Feature: User Authentication
-""".strip())
-    (auth_story_dir / "_story.md").write_text("""
----
-story_id: login
-priority: high
-tags: [auth-flow]
----
-
-# Story: Login
-""".strip())
-    (auth_story_dir / "login_success.md").write_text("""
----
-scenario_id: login-success
-priority: high
-tags: [smoke, critical, auth-flow]
-execution_time: fast
----
-
-# Scenario: Successful login
-
-## Steps
-- **Given** user has valid credentials
-- **When** user logs in
-- **Then** user sees dashboard
-""".strip())
-    (auth_story_dir / "login_failure.md").write_text("""
----
-scenario_id: login-failure
-priority: medium
-tags: [regression, negative]
-execution_time: fast
----
-
-# Scenario: Failed login
-
-## Steps
-- **Given** user has invalid credentials
-- **When** user tries to log in
-- **Then** user sees error message
-""".strip())
-
-    (features_dir / "parse" / "_feature.md").write_text("""
----
-feature_id: parse
-priority: high
-tags: [unit]
----
-
-# Feature: Unit Parsing
-""".strip())
-    (parse_story_dir / "_story.md").write_text("""
----
-story_id: units
-priority: medium
-tags: [parsing]
----
-
-# Story: Units
-""".strip())
-    (parse_story_dir / "extract_unit.md").write_text("""
----
-scenario_id: extract-unit
-priority: medium
-tags: [unit, parsing]
-execution_time: fast
----
-
-# Scenario: Extract unit from string
-
-## Steps
-- **When** extracting unit
-- **Then** unit is correct
-""".strip())
+    for relative_path, content in _SPECS_TREE_FILES.items():
+        (features_dir / relative_path).write_bytes(content)
 
     return features_dir
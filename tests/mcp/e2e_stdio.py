@@ -6,30 +6,25 @@ building and installing the wheel artifact.
 
 from __future__ import annotations
 
+import io
 import json
-import selectors
+import os
+import queue
 import subprocess
 import sys
+import tempfile
+import threading
 import time
-from dataclasses import dataclass
-from typing import Any
+from typing import IO, Any, cast
 
 DEFAULT_TIMEOUT_SECONDS = 8.0
-
-
-@dataclass(frozen=True)
-class JsonRpcResponse:
-    """A parsed JSON-RPC response payload."""
-
-    payload: dict[str, Any]
-
-    @property
-    def message_id(self) -> int | str | None:
-        return self.payload.get("id")
+STDERR_TAIL_BYTES = 8192
 
 
 def _encode_message(message: dict[str, Any]) -> bytes:
-    body = json.dumps(message, separators=(",", ":"), ensure_ascii=True).encode("utf-8")
+    body = json.dumps(message, separators=(",", ":"), ensure_ascii=False).encode(
+        "utf-8"
+    )
     return body + b"\n"
 
 
@@ -38,7 +33,6 @@ def _send_message(proc: subprocess.Popen[bytes], message: dict[str, Any]) -> Non
     if stdin is None:
         raise RuntimeError("MCP process stdin is unavailable.")
     stdin.write(_encode_message(message))
-    stdin.flush()
 
 
 def _send_request(
@@ -66,65 +60,91 @@ def _send_notification(
     _send_message(proc, message)
 
 
+class _StdoutReader:
+    """Pump MCP server stdout lines onto a queue from a background thread."""
+
+    def __init__(self, proc: subprocess.Popen[bytes]) -> None:
+        stdout = proc.stdout
+        if stdout is None:
+            raise RuntimeError("MCP process stdout is unavailable.")
+        self._lines: queue.Queue[bytes | None] = queue.Queue()
+        self._eof = False
+        self._thread = threading.Thread(
+            target=self._pump, args=(stdout,), name="mcp-stdout", daemon=True
+        )
+        self._thread.start()
+
+    def _pump(self, stdout: IO[bytes]) -> None:
+        # Pipes are unbuffered (bufsize=0); buffer reads here so readline()
+        # does not issue one syscall per byte.
+        buffered = io.BufferedReader(cast(io.RawIOBase, stdout))
+        for line in iter(buffered.readline, b""):
+            self._lines.put(line)
+        self._lines.put(None)
+
+    def read_line(self, timeout_seconds: float) -> bytes | None:
+        """Return the next stdout line, or None on EOF or timeout."""
+        if self._eof:
+            return None
+        try:
+            line = self._lines.get(timeout=timeout_seconds)
+        except queue.Empty:
+            return None
+        if line is None:
+            self._eof = True
+        return line
+
+    def join(self, timeout_seconds: float = 3.0) -> None:
+        self._thread.join(timeout=timeout_seconds)
+
+
 def _read_frame(
-    proc: subprocess.Popen[bytes],
+    reader: _StdoutReader,
     *,
     timeout_seconds: float = DEFAULT_TIMEOUT_SECONDS,
 ) -> dict[str, Any] | None:
-    stdout = proc.stdout
-    if stdout is None:
-        raise RuntimeError("MCP process stdout is unavailable.")
-
-    selector = selectors.DefaultSelector()
-    selector.register(stdout, selectors.EVENT_READ)
-
-    buffer = bytearray()
     deadline = time.monotonic() + timeout_seconds
 
-    while time.monotonic() < deadline:
-        events = selector.select(timeout=0.1)
-        if not events:
-            if proc.poll() is not None:
-                return None
+    while (remaining := deadline - time.monotonic()) > 0:
+        line = reader.read_line(remaining)
+        if line is None:
+            return None
+        line = line.strip()
+        if not line:
             continue
-
-        chunk = stdout.read1(4096)
-        if not chunk:
+        try:
+            payload = json.loads(line)
+        except json.JSONDecodeError:
+            # Skip non-JSON lines (for example, server log output).
             continue
-        buffer.extend(chunk)
-
-        while b"\n" in buffer:
-            line, _, remainder = bytes(buffer).partition(b"\n")
-            buffer = bytearray(remainder)
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                payload = json.loads(line.decode("utf-8"))
-            except json.JSONDecodeError:
-                # Skip non-JSON lines (for example, server log output).
-                continue
-            if isinstance(payload, dict):
-                return payload
+        if isinstance(payload, dict):
+            return payload
 
     return None
 
 
 def _read_response_for_id(
-    proc: subprocess.Popen[bytes],
+    reader: _StdoutReader,
     *,
     msg_id: int,
+    received: dict[int | str | None, dict[str, Any]],
     timeout_seconds: float = DEFAULT_TIMEOUT_SECONDS,
-) -> JsonRpcResponse | None:
+) -> dict[str, Any] | None:
+    """Return the response for msg_id, stashing other responses in received.
+
+    Requests may be pipelined, so replies for later ids can arrive first.
+    """
+    if msg_id in received:
+        return received.pop(msg_id)
     deadline = time.monotonic() + timeout_seconds
-    while time.monotonic() < deadline:
-        remaining = max(deadline - time.monotonic(), 0.1)
-        payload = _read_frame(proc, timeout_seconds=remaining)
+    while (remaining := deadline - time.monotonic()) > 0:
+        payload = _read_frame(reader, timeout_seconds=remaining)
         if payload is None:
             return None
-        response = JsonRpcResponse(payload=payload)
-        if response.message_id == msg_id:
-            return response
+        message_id = payload.get("id")
+        if message_id == msg_id:
+            return payload
+        received[message_id] = payload
     return None
 
 
@@ -139,23 +159,23 @@ def _terminate_process(proc: subprocess.Popen[bytes]) -> None:
         proc.wait(timeout=3)
 
 
-def _stderr_tail(proc: subprocess.Popen[bytes]) -> str:
-    if proc.poll() is None:
-        return ""
-    stderr = proc.stderr
-    if stderr is None:
-        return ""
-    data = stderr.read().decode("utf-8", errors="replace").strip()
-    return data
+def _stderr_tail(stderr_log: IO[bytes]) -> str:
+    """Return at most the last STDERR_TAIL_BYTES the server wrote to stderr."""
+    size = stderr_log.seek(0, os.SEEK_END)
+    stderr_log.seek(max(size - STDERR_TAIL_BYTES, 0))
+    return stderr_log.read().decode("utf-8", errors="replace").strip()
 
 
-def main() -> int:
+def _run_checks(stderr_log: IO[bytes]) -> int:
     proc = subprocess.Popen(
         [sys.executable, "-m", "specleft.mcp"],
         stdin=subprocess.PIPE,
         stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
+        stderr=stderr_log,
+        bufsize=0,
     )
+    reader = _StdoutReader(proc)
+    received: dict[int | str | None, dict[str, Any]] = {}
 
     failures: list[str] = []
     stderr_hint = ""
@@ -171,11 +191,11 @@ def main() -> int:
                 "clientInfo": {"name": "specleft-mcp-e2e", "version": "1.0.0"},
             },
         )
-        response = _read_response_for_id(proc, msg_id=1)
-        if response is None or "result" not in response.payload:
+        response = _read_response_for_id(reader, msg_id=1, received=received)
+        if response is None or "result" not in response:
             failures.append("initialize did not return a valid result")
         else:
-            server_info = response.payload["result"].get("serverInfo", {})
+            server_info = response["result"].get("serverInfo", {})
             if not isinstance(server_info, dict) or not server_info.get("name"):
                 failures.append("initialize result missing serverInfo.name")
             else:
@@ -183,12 +203,22 @@ def main() -> int:
 
         _send_notification(proc, method="notifications/initialized")
 
+        # The remaining requests are independent, so pipeline them and
+        # collect the replies by id.
         _send_request(proc, method="resources/list", msg_id=2)
-        response = _read_response_for_id(proc, msg_id=2)
-        if response is None or "result" not in response.payload:
+        _send_request(proc, method="tools/list", msg_id=3)
+        _send_request(
+            proc,
+            method="resources/read",
+            msg_id=4,
+            params={"uri": "specleft://contract"},
+        )
+
+        response = _read_response_for_id(reader, msg_id=2, received=received)
+        if response is None or "result" not in response:
             failures.append("resources/list did not return a valid result")
         else:
-            resources = response.payload["result"].get("resources", [])
+            resources = response["result"].get("resources", [])
             uris = {
                 item.get("uri")
                 for item in resources
@@ -206,12 +236,11 @@ def main() -> int:
             else:
                 print("[PASS] resources/list returns 3 expected resources")
 
-        _send_request(proc, method="tools/list", msg_id=3)
-        response = _read_response_for_id(proc, msg_id=3)
-        if response is None or "result" not in response.payload:
+        response = _read_response_for_id(reader, msg_id=3, received=received)
+        if response is None or "result" not in response:
             failures.append("tools/list did not return a valid result")
         else:
-            tools = response.payload["result"].get("tools", [])
+            tools = response["result"].get("tools", [])
             if len(tools) != 1:
                 failures.append(f"tools/list returned {len(tools)} tools expected 1")
             elif (
@@ -222,19 +251,13 @@ def main() -> int:
             else:
                 print("[PASS] tools/list returns specleft_init")
 
-        _send_request(
-            proc,
-            method="resources/read",
-            msg_id=4,
-            params={"uri": "specleft://contract"},
-        )
-        response = _read_response_for_id(proc, msg_id=4)
-        if response is None or "result" not in response.payload:
+        response = _read_response_for_id(reader, msg_id=4, received=received)
+        if response is None or "result" not in response:
             failures.append(
                 "resources/read for specleft://contract did not return a valid result"
             )
         else:
-            contents = response.payload["result"].get("contents", [])
+            contents = response["result"].get("contents", [])
             first_item = contents[0] if contents else {}
             text = first_item.get("text") if isinstance(first_item, dict) else None
             if not isinstance(text, str):
@@ -248,7 +271,8 @@ def main() -> int:
 
     finally:
         _terminate_process(proc)
-        stderr_hint = _stderr_tail(proc)
+        reader.join()
+        stderr_hint = _stderr_tail(stderr_log)
 
     if failures:
         print(f"[FAIL] MCP stdio E2E checks failed ({len(failures)}):")
@@ -262,5 +286,12 @@ def main() -> int:
     return 0
 
 
+def main() -> int:
+    # Log stderr to a file rather than a pipe so a chatty server can never
+    # block on a full pipe buffer that nobody is draining.
+    with tempfile.TemporaryFile() as stderr_log:
+        return _run_checks(stderr_log)
+
+
 if __name__ == "__main__":
     raise SystemExit(main())
@@ -2,8 +2,6 @@
 
 from __future__ import annotations
 
-import hashlib
-import stat
 from pathlib import Path
 
 import pytest
@@ -15,6 +13,8 @@ from specleft.mcp.init_tool import (
 )
 from specleft.utils.skill_integrity import verify_skill_integrity
 
+from tests.helpers.filesystem import file_sha256_and_mode
+
 
 def test_ensure_safe_write_target_rejects_traversal(tmp_path: Path) -> None:
     with pytest.raises(SecurityError, match="Path traversal"):
@@ -50,10 +50,8 @@ def test_init_generates_verified_read_only_skill_file(
     skill_file = tmp_path / ".specleft" / "SKILL.md"
     checksum_file = tmp_path / ".specleft" / "SKILL.md.sha256"
 
-    skill_hash = hashlib.sha256(skill_file.read_bytes()).hexdigest()
+    skill_hash, mode = file_sha256_and_mode(skill_file)
     assert checksum_file.read_text().strip() == skill_hash
-
-    mode = stat.S_IMODE(skill_file.stat().st_mode)
     assert mode == 0o444
 
     integrity = verify_skill_integrity().to_payload()
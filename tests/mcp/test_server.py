@@ -13,14 +13,26 @@ from specleft import specleft
 from specleft.mcp.payloads import build_mcp_status_payload
 from specleft.mcp.server import build_mcp_server
 from specleft.validator import load_specs_directory
+from tests.helpers.filesystem import dir_snapshot
 from tests.helpers.specs import create_feature_specs
 
 
+@pytest.fixture(scope="module")
+def mcp_server() -> Any:
+    """Build the SpecLeft MCP server once for this module.
+
+    The server holds no per-project state; resources and tools resolve the
+    working directory on each call, so tests can share one instance.
+    """
+    pytest.importorskip("fastmcp")
+    return build_mcp_server()
+
+
 @pytest.fixture
-def mcp_client() -> Any:
-    """Return an in-memory FastMCP client for the SpecLeft server."""
+def mcp_client(mcp_server: Any) -> Any:
+    """Return an in-memory FastMCP client for the shared SpecLeft server."""
     fastmcp = pytest.importorskip("fastmcp")
-    return fastmcp.Client(build_mcp_server())
+    return fastmcp.Client(mcp_server)
 
 
 def _resource_json(result: list[Any]) -> dict[str, object]:
@@ -160,13 +172,13 @@ async def test_init_tool_dry_run_writes_nothing(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     monkeypatch.chdir(tmp_path)
-    before = {path.relative_to(tmp_path) for path in tmp_path.rglob("*")}
+    before = dir_snapshot(tmp_path)
 
     async with mcp_client:
         result = await mcp_client.call_tool("specleft_init", {"dry_run": True})
     payload = json.loads(result.content[0].text)
 
-    after = {path.relative_to(tmp_path) for path in tmp_path.rglob("*")}
+    after = dir_snapshot(tmp_path)
 
     assert payload["success"] is True
     assert payload["dry_run"] is True
@@ -200,21 +212,22 @@ async def test_init_tool_is_idempotent(
     assert (tmp_path / ".specleft" / "SKILL.md").is_file()
 
 
-def test_status_payload_verbose_shape(
-    tmp_path: Path,
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
-    monkeypatch.chdir(tmp_path)
-    create_feature_specs(
+def test_status_payload_verbose_shape(tmp_path: Path) -> None:
+    specs_dir = create_feature_specs(
         tmp_path,
         feature_id="feature-auth",
         story_id="login",
         scenario_id="user-can-login",
     )
+    tests_dir = tmp_path / "tests"
 
-    payload = build_mcp_status_payload(verbose=True)
-    config = load_specs_directory(Path(".specleft/specs"))
-    entries = build_status_entries(config, Path("tests"))
+    payload = build_mcp_status_payload(
+        verbose=True,
+        features_dir=str(specs_dir),
+        tests_dir=tests_dir,
+    )
+    config = load_specs_directory(specs_dir)
+    entries = build_status_entries(config, tests_dir)
     expected = build_status_json(
         entries,
         include_execution_time=False,
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import json
 from collections.abc import Callable
 from typing import Any
@@ -11,13 +12,22 @@ import pytest
 from specleft.mcp.payloads import build_mcp_contract_payload, build_mcp_guide_payload
 from specleft.mcp.server import build_mcp_server
 
+tiktoken = pytest.importorskip("tiktoken")
 
-def _count_tokens(payload: str) -> int:
-    tiktoken = pytest.importorskip("tiktoken")
+
+@functools.cache
+def _get_encoding() -> Any:
+    """Load cl100k_base once per session; a load error is cached as a string."""
     try:
-        encoding = tiktoken.get_encoding("cl100k_base")
+        return tiktoken.get_encoding("cl100k_base")
     except Exception as exc:  # pragma: no cover - depends on network/cache state
-        pytest.skip(f"Unable to load cl100k_base encoding: {exc}")
+        return f"Unable to load cl100k_base encoding: {exc}"
+
+
+def _count_tokens(payload: str) -> int:
+    encoding = _get_encoding()
+    if isinstance(encoding, str):  # pragma: no cover - depends on network/cache state
+        pytest.skip(encoding)
     return len(encoding.encode(payload))
 
 
@@ -9,29 +9,26 @@ from specleft.parser import SpecParser
 from specleft.schema import ExecutionTime, Priority, SpecsConfig, StepType
 from specleft.validator import collect_spec_stats, load_specs_directory
 
+from tests.helpers.filesystem import materialize
 
-def _write_file(path: Path, content: str) -> None:
-    path.write_text(content)
 
+@pytest.fixture(scope="module")
+def parser() -> SpecParser:
+    """Share one default-template parser; parsing keeps no per-call state."""
+    return SpecParser()
 
-def test_parse_directory_missing(tmp_path: Path) -> None:
-    parser = SpecParser()
 
+def test_parse_directory_missing(parser: SpecParser, tmp_path: Path) -> None:
     missing = tmp_path / "features"
     with pytest.raises(FileNotFoundError):
         parser.parse_directory(missing)
 
 
-def test_parse_minimal_tree(tmp_path: Path) -> None:
-    parser = SpecParser()
-
-    feature_dir = tmp_path / "calculator"
-    story_dir = feature_dir / "addition"
-    story_dir.mkdir(parents=True)
-
-    _write_file(
-        story_dir / "basic_addition.md",
-        """
+def test_parse_minimal_tree(parser: SpecParser, tmp_path: Path) -> None:
+    materialize(
+        tmp_path,
+        {
+            "calculator/addition/basic_addition.md": """
 ---
 scenario_id: basic-addition
 priority: critical
@@ -48,6 +45,7 @@ Adds two numbers together.
 - **When** adding `2` and `3`
 - **Then** result should be `5`
 """.strip(),
+        },
     )
 
     config = parser.parse_directory(tmp_path)
@@ -66,16 +64,11 @@ Adds two numbers together.
     assert scenario.steps[1].description == "adding 2 and 3"
 
 
-def test_parse_feature_story_files(tmp_path: Path) -> None:
-    parser = SpecParser()
-
-    feature_dir = tmp_path / "string_utils"
-    story_dir = feature_dir / "uppercase"
-    story_dir.mkdir(parents=True)
-
-    _write_file(
-        feature_dir / "_feature.md",
-        """
+def test_parse_feature_story_files(parser: SpecParser, tmp_path: Path) -> None:
+    materialize(
+        tmp_path,
+        {
+            "string_utils/_feature.md": """
 ---
 feature_id: string-utils
 component: text
@@ -88,11 +81,7 @@ tags: [core]
 
 Feature description text.
 """.strip(),
-    )
-
-    _write_file(
-        story_dir / "_story.md",
-        """
+            "string_utils/uppercase/_story.md": """
 ---
 story_id: uppercase
 priority: medium
@@ -103,11 +92,7 @@ tags: [smoke, text]
 
 Converts input to uppercase.
 """.strip(),
-    )
-
-    _write_file(
-        story_dir / "convert_to_uppercase.md",
-        """
+            "string_utils/uppercase/convert_to_uppercase.md": """
 ---
 scenario_id: convert-to-uppercase
 priority: low
@@ -122,6 +107,7 @@ execution_time: medium
 - **When** converting to uppercase
 - **Then** result is `HELLO`
 """.strip(),
+        },
     )
 
     config = parser.parse_directory(tmp_path)
@@ -142,16 +128,11 @@ execution_time: medium
     assert scenario.execution_time == ExecutionTime.MEDIUM
 
 
-def test_parse_test_data_table(tmp_path: Path) -> None:
-    parser = SpecParser()
-
-    feature_dir = tmp_path / "calculator"
-    story_dir = feature_dir / "addition"
-    story_dir.mkdir(parents=True)
-
-    _write_file(
-        story_dir / "basic_addition.md",
-        """
+def test_parse_test_data_table(parser: SpecParser, tmp_path: Path) -> None:
+    materialize(
+        tmp_path,
+        {
+            "calculator/addition/basic_addition.md": """
 ---
 scenario_id: basic-addition
 priority: critical
@@ -169,6 +150,7 @@ priority: critical
 - **When** adding `{a}` and `{b}`
 - **Then** result should be `{expected}`
 """.strip(),
+        },
     )
 
     config = parser.parse_directory(tmp_path)
@@ -180,16 +162,11 @@ priority: critical
     assert scenario.test_data[1].description == "Medium numbers"
 
 
-def test_parse_description_block(tmp_path: Path) -> None:
-    parser = SpecParser()
-
-    feature_dir = tmp_path / "calculator"
-    story_dir = feature_dir / "addition"
-    story_dir.mkdir(parents=True)
-
-    _write_file(
-        story_dir / "basic_addition.md",
-        """
+def test_parse_description_block(parser: SpecParser, tmp_path: Path) -> None:
+    materialize(
+        tmp_path,
+        {
+            "calculator/addition/basic_addition.md": """
 ---
 scenario_id: basic-addition
 ---
@@ -202,6 +179,7 @@ It should support multiple lines.
 ## Steps
 - **Given** calculator is ready
 """.strip(),
+        },
     )
 
     config = parser.parse_directory(tmp_path)
@@ -214,13 +192,10 @@ It should support multiple lines.
 
 
 def test_load_specs_directory_and_stats(tmp_path: Path) -> None:
-    feature_dir = tmp_path / "calculator"
-    story_dir = feature_dir / "addition"
-    story_dir.mkdir(parents=True)
-
-    _write_file(
-        feature_dir / "_feature.md",
-        """
+    materialize(
+        tmp_path,
+        {
+            "calculator/_feature.md": """
 ---
 feature_id: calculator
 priority: high
@@ -228,11 +203,7 @@ priority: high
 
 # Feature: Calculator
 """.strip(),
-    )
-
-    _write_file(
-        story_dir / "_story.md",
-        """
+            "calculator/addition/_story.md": """
 ---
 story_id: addition
 priority: low
@@ -241,11 +212,7 @@ tags: [math]
 
 # Story: Addition
 """.strip(),
-    )
-
-    _write_file(
-        story_dir / "basic_addition.md",
-        """
+            "calculator/addition/basic_addition.md": """
 ---
 scenario_id: basic-addition
 priority: critical
@@ -259,6 +226,7 @@ tags: [smoke]
 - **When** adding numbers
 - **Then** result is shown
 """.strip(),
+        },
     )
 
     config = load_specs_directory(tmp_path)
@@ -276,9 +244,10 @@ tags: [smoke]
 # ---------------------------------------------------------------------------
 
 
-def test_parse_single_file_with_feature_prefix(tmp_path: Path) -> None:
+def test_parse_single_file_with_feature_prefix(
+    parser: SpecParser, tmp_path: Path
+) -> None:
     """Parser handles the standard '# Feature: Title' heading."""
-    parser = SpecParser()
     features_dir = tmp_path / "specs"
     features_dir.mkdir()
 
@@ -301,13 +270,14 @@ def test_parse_single_file_with_feature_prefix(tmp_path: Path) -> None:
     assert config.features[0].feature_id == "auth"
 
 
-def test_parse_single_file_bare_title_falls_back(tmp_path: Path) -> None:
+def test_parse_single_file_bare_title_falls_back(
+    parser: SpecParser, tmp_path: Path
+) -> None:
     """Parser falls back to the raw H1 text when no template pattern matches.
 
     This is the exact bug from issue #85: ``specleft plan`` generated
     headings like ``# Document Lifecycle`` (no ``Feature:`` prefix).
     """
-    parser = SpecParser()
     features_dir = tmp_path / "specs"
     features_dir.mkdir()
 
@@ -364,9 +334,10 @@ def test_parse_single_file_custom_template_pattern(tmp_path: Path) -> None:
     assert config.features[0].name == "Billing Module"
 
 
-def test_parse_single_file_feature_word_no_colon(tmp_path: Path) -> None:
+def test_parse_single_file_feature_word_no_colon(
+    parser: SpecParser, tmp_path: Path
+) -> None:
     """Parser matches the default 'Feature {title}' pattern (no colon)."""
-    parser = SpecParser()
     features_dir = tmp_path / "specs"
     features_dir.mkdir()
 
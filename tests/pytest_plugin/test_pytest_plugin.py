@@ -11,8 +11,10 @@ Tests cover:
 from __future__ import annotations
 
 import json
+import os
+import shutil
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, cast
 
 import pytest
 
@@ -22,6 +24,42 @@ if TYPE_CHECKING:
     from pytest import Pytester
 
 
+# Test module shared by the nested runs that only need one decorated test.
+_LOGIN_SUCCESS_TEST = """\
+from specleft import specleft
+
+@specleft(feature_id="auth", scenario_id="login-success")
+def test_login():
+    pass
+"""
+
+
+def _load_results_file(results_dir: Path) -> dict[str, Any]:
+    """Load the single results_*.json file a nested run wrote."""
+    with os.scandir(results_dir) as entries:
+        matches = [
+            entry.path
+            for entry in entries
+            if entry.name.startswith("results_") and entry.name.endswith(".json")
+        ]
+    assert len(matches) == 1, "One results file should exist"
+    with open(matches[0], "rb") as handle:
+        return cast(dict[str, Any], json.load(handle))
+
+
+class _MetadataRecorder:
+    """In-process plugin that records SpecLeft metadata per collected test."""
+
+    def __init__(self) -> None:
+        self.metadata: dict[str, dict[str, Any]] = {}
+
+    def pytest_collection_finish(self, session: pytest.Session) -> None:
+        for item in session.items:
+            metadata = getattr(item, "_specleft_metadata", None)
+            if metadata is not None:
+                self.metadata[item.name] = dict(metadata)
+
+
 @pytest.fixture
 def create_specs_tree(pytester: Pytester) -> Path:
     """Create a Markdown specs tree in the test directory."""
@@ -34,11 +72,28 @@ def ensure_specs_tree(create_specs_tree: Path) -> None:
     _ = create_specs_tree
 
 
+@pytest.fixture
+def no_specs_tree(pytester: Pytester) -> None:
+    """Empty the default specs directory for tests that run without specs."""
+    specs_dir = pytester.path / ".specleft" / "specs"
+    shutil.rmtree(specs_dir, ignore_errors=True)
+    specs_dir.mkdir(parents=True)
+
+
 @pytest.fixture(autouse=True)
-def configure_pytest_asyncio(pytester: Pytester) -> None:
-    """Configure pytest-asyncio defaults for nested test runs."""
+def configure_nested_runs(pytester: Pytester, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Write the ini used by nested test runs.
+
+    Sets pytest-asyncio defaults and disables the cache provider: inner runs
+    never use --lf/--ff, so writing .pytest_cache after each one is wasted.
+    Entry-point autoloading is off too; inner runs load only the SpecLeft and
+    pytest-asyncio plugins they exercise instead of rescanning every
+    installed distribution.
+    """
+    monkeypatch.setenv("PYTEST_DISABLE_PLUGIN_AUTOLOAD", "1")
     pytester.makeini("""
 [pytest]
+addopts = -p no:cacheprovider -p specleft.pytest_plugin -p pytest_asyncio.plugin
 asyncio_mode = auto
 asyncio_default_fixture_loop_scope = function
 """)
@@ -56,41 +111,29 @@ class TestPytestConfigure:
             def test_dummy():
                 pass
             """)
-        result = pytester.runpytest("-v")
+        result = pytester.runpytest()
         result.assert_outcomes(passed=1)
 
     def test_metadata_stored_on_item(
         self, pytester: Pytester, create_specs_tree
     ) -> None:
         """Test that metadata is stored on test items."""
-        pytester.makeconftest("""
-            def pytest_runtest_setup(item):
-                if hasattr(item, '_specleft_metadata'):
-                    metadata = item._specleft_metadata
-                    assert metadata['feature_id'] == 'auth'
-                    assert metadata['scenario_id'] == 'login-success'
-            """)
-        pytester.makepyfile("""
-            from specleft import specleft
-
-            @specleft(feature_id="auth", scenario_id="login-success")
-            def test_login():
-                pass
-            """)
-        result = pytester.runpytest()
+        recorder = _MetadataRecorder()
+        pytester.makepyfile(_LOGIN_SUCCESS_TEST)
+        result = pytester.runpytest(plugins=[recorder])
         result.assert_outcomes(passed=1)
 
+        metadata = recorder.metadata["test_login"]
+        assert metadata["feature_id"] == "auth"
+        assert metadata["scenario_id"] == "login-success"
+
 
 class TestMissingSpecsDirectory:
     """Tests for handling missing specs directories."""
 
+    @pytest.mark.usefixtures("no_specs_tree")
     def test_no_specs_directory_runs_all_tests(self, pytester: Pytester) -> None:
         """Test that tests run without validation when specs are missing."""
-        features_dir = pytester.path / ".specleft" / "specs"
-        if features_dir.exists():
-            for path in features_dir.rglob("*"):
-                if path.is_file():
-                    path.unlink()
         pytester.makepyfile("""
             from specleft import specleft
 
@@ -98,17 +141,12 @@ class TestMissingSpecsDirectory:
             def test_without_validation():
                 pass
             """)
-        result = pytester.runpytest("-v")
+        result = pytester.runpytest()
         result.assert_outcomes(passed=1)
 
+    @pytest.mark.usefixtures("no_specs_tree")
     def test_metadata_defaults_when_no_specs(self, pytester: Pytester) -> None:
         """Test metadata defaults when specs are missing."""
-        features_dir = pytester.path / ".specleft" / "specs"
-        if features_dir.exists():
-            for path in features_dir.rglob("*"):
-                if path.is_file():
-                    path.unlink()
-
         pytester.makepyfile("""
             from specleft import specleft
 
@@ -116,71 +154,67 @@ class TestMissingSpecsDirectory:
             def test_without_metadata():
                 pass
             """)
-        pytester.makeconftest("""
-            def pytest_runtest_call(item):
-                metadata = item._specleft_metadata
-                assert metadata.get('feature_name') is None
-                assert metadata.get('scenario_name') is None
-                assert metadata.get('tags') == []
-            """)
-        result = pytester.runpytest("-v")
+        recorder = _MetadataRecorder()
+        result = pytester.runpytest(plugins=[recorder])
         result.assert_outcomes(passed=1)
 
+        metadata = recorder.metadata["test_without_metadata"]
+        assert metadata.get("feature_name") is None
+        assert metadata.get("scenario_name") is None
+        assert metadata.get("tags") == []
+
 
 class TestMarkerInjection:
     """Tests for runtime marker injection from scenario tags."""
 
+    @pytest.mark.parametrize(
+        ("args", "outcome"),
+        [
+            ((), {"passed": 1}),
+            (("--specleft-tag", "smoke"), {"passed": 1}),
+            (("--specleft-tag", "critical"), {"passed": 1}),
+            (("--specleft-tag", "missing"), {"skipped": 1}),
+        ],
+        ids=["no-filter", "smoke", "critical", "missing"],
+    )
     def test_markers_injected_from_tags(
-        self, pytester: Pytester, create_specs_tree
+        self,
+        pytester: Pytester,
+        create_specs_tree,
+        args: tuple[str, ...],
+        outcome: dict[str, int],
     ) -> None:
         """Test that markers are injected from scenario tags."""
-        pytester.makepyfile("""
-            from specleft import specleft
-
-            @specleft(feature_id="auth", scenario_id="login-success")
-            def test_login():
-                pass
-            """)
-        pytester.makeconftest("""
-            def pytest_collection_modifyitems(session, config, items):
-                for item in items:
-                    if hasattr(item, '_specleft_metadata'):
-                        metadata = item._specleft_metadata
-                        assert metadata['feature_name'] == 'User Authentication'
-                        assert metadata['scenario_name'] == 'Successful login'
-                        assert 'smoke' in metadata['tags']
-            """)
-        result = pytester.runpytest("-v")
-        result.assert_outcomes(passed=1)
-
-        result = pytester.runpytest("-v", "--specleft-tag", "smoke")
-        result.assert_outcomes(passed=1)
-
-        result = pytester.runpytest("-v", "--specleft-tag", "critical")
-        result.assert_outcomes(passed=1)
-
-        result = pytester.runpytest("-v", "--specleft-tag", "missing")
-        result.assert_outcomes(skipped=1)
-
+        recorder = _MetadataRecorder()
+        pytester.makepyfile(_LOGIN_SUCCESS_TEST)
+        result = pytester.runpytest(*args, plugins=[recorder])
+        result.assert_outcomes(**outcome)
+
+        metadata = recorder.metadata["test_login"]
+        assert metadata["feature_name"] == "User Authentication"
+        assert metadata["scenario_name"] == "Successful login"
+        assert "smoke" in metadata["tags"]
+
+    @pytest.mark.parametrize(
+        ("args", "outcome"),
+        [
+            ((), {"passed": 1}),
+            (("--specleft-priority", "high"), {"passed": 1}),
+            (("--specleft-priority", "critical"), {"skipped": 1}),
+        ],
+        ids=["no-filter", "high", "critical"],
+    )
     def test_priority_marker_injected(
-        self, pytester: Pytester, create_specs_tree
+        self,
+        pytester: Pytester,
+        create_specs_tree,
+        args: tuple[str, ...],
+        outcome: dict[str, int],
     ) -> None:
         """Test that priority markers are injected from spec priority."""
-        pytester.makepyfile("""
-            from specleft import specleft
-
-            @specleft(feature_id="auth", scenario_id="login-success")
-            def test_login():
-                pass
-            """)
-        result = pytester.runpytest("-v")
-        result.assert_outcomes(passed=1)
-
-        result = pytester.runpytest("-v", "--specleft-priority", "high")
-        result.assert_outcomes(passed=1)
-
-        result = pytester.runpytest("-v", "--specleft-priority", "critical")
-        result.assert_outcomes(skipped=1)
+        pytester.makepyfile(_LOGIN_SUCCESS_TEST)
+        result = pytester.runpytest(*args)
+        result.assert_outcomes(**outcome)
 
 
 class TestStepCollection:
@@ -200,7 +234,7 @@ class TestStepCollection:
                 with step("Then user sees dashboard"):
                     pass
             """)
-        result = pytester.runpytest("-v")
+        result = pytester.runpytest()
         result.assert_outcomes(passed=1)
 
 
@@ -209,23 +243,14 @@ class TestResultPersistence:
 
     def test_results_saved_to_disk(self, pytester: Pytester, create_specs_tree) -> None:
         """Test that results are saved to .specleft/results/."""
-        pytester.makepyfile("""
-            from specleft import specleft
-
-            @specleft(feature_id="auth", scenario_id="login-success")
-            def test_login():
-                pass
-            """)
-        result = pytester.runpytest("-v")
+        pytester.makepyfile(_LOGIN_SUCCESS_TEST)
+        result = pytester.runpytest()
         result.assert_outcomes(passed=1)
 
         results_dir = pytester.path / ".specleft" / "results"
         assert results_dir.exists(), "Results directory should exist"
 
-        json_files = list(results_dir.glob("results_*.json"))
-        assert len(json_files) == 1, "One results file should exist"
-
-        results_data = json.loads(json_files[0].read_text())
+        results_data = _load_results_file(results_dir)
         assert "summary" in results_data
         assert results_data["summary"]["passed"] == 1
         assert results_data["features"][0]["feature_name"] == "User Authentication"
@@ -354,17 +379,9 @@ class TestDynamicMarkerRegistration:
         self, pytester: Pytester, create_specs_tree
     ) -> None:
         """Test that no PytestUnknownMarkWarning is raised for scenario tags."""
-        pytester.makepyfile("""
-            from specleft import specleft
-
-            @specleft(feature_id="auth", scenario_id="login-success")
-            def test_login():
-                pass
-            """)
+        pytester.makepyfile(_LOGIN_SUCCESS_TEST)
         # Run with -W error to turn warnings into errors
-        result = pytester.runpytest(
-            "-v", "-W", "error::pytest.PytestUnknownMarkWarning"
-        )
+        result = pytester.runpytest("-W", "error::pytest.PytestUnknownMarkWarning")
         result.assert_outcomes(passed=1)
         # Should not contain any unknown marker warnings
         assert "PytestUnknownMarkWarning" not in result.stdout.str()
@@ -387,7 +404,6 @@ class TestDynamicMarkerRegistration:
             """)
         # Run with strict markers and turn warnings to errors
         result = pytester.runpytest(
-            "-v",
             "--strict-markers",
             "-W",
             "error::pytest.PytestUnknownMarkWarning",
@@ -407,7 +423,6 @@ class TestDynamicMarkerRegistration:
                 pass
             """)
         result = pytester.runpytest(
-            "-v",
             "--strict-markers",
             "-W",
             "error::pytest.PytestUnknownMarkWarning",
@@ -430,14 +445,11 @@ class TestSkippedTestCapture:
             def test_skipped():
                 pass
             """)
-        result = pytester.runpytest("-v")
+        result = pytester.runpytest()
         result.assert_outcomes(skipped=1)
 
         results_dir = pytester.path / ".specleft" / "results"
-        json_files = list(results_dir.glob("results_*.json"))
-        assert len(json_files) == 1
-
-        results_data = json.loads(json_files[0].read_text())
+        results_data = _load_results_file(results_dir)
         assert results_data["summary"]["skipped"] == 1
         assert results_data["summary"]["total_executions"] == 1
 
@@ -454,14 +466,11 @@ class TestSkippedTestCapture:
             def test_skipped_by_marker():
                 pass
             """)
-        result = pytester.runpytest("-v")
+        result = pytester.runpytest()
         result.assert_outcomes(skipped=1)
 
         results_dir = pytester.path / ".specleft" / "results"
-        json_files = list(results_dir.glob("results_*.json"))
-        assert len(json_files) == 1
-
-        results_data = json.loads(json_files[0].read_text())
+        results_data = _load_results_file(results_dir)
         assert results_data["summary"]["skipped"] == 1
 
     def test_mixed_passed_and_skipped_results(
@@ -480,12 +489,11 @@ class TestSkippedTestCapture:
             def test_skipped():
                 pass
             """)
-        result = pytester.runpytest("-v")
+        result = pytester.runpytest()
         result.assert_outcomes(passed=1, skipped=1)
 
         results_dir = pytester.path / ".specleft" / "results"
-        json_files = list(results_dir.glob("results_*.json"))
-        results_data = json.loads(json_files[0].read_text())
+        results_data = _load_results_file(results_dir)
 
         assert results_data["summary"]["passed"] == 1
         assert results_data["summary"]["skipped"] == 1
@@ -506,12 +514,11 @@ class TestTagsInMetadata:
             def test_with_tags():
                 pass
             """)
-        result = pytester.runpytest("-v")
+        result = pytester.runpytest()
         result.assert_outcomes(passed=1)
 
         results_dir = pytester.path / ".specleft" / "results"
-        json_files = list(results_dir.glob("results_*.json"))
-        results_data = json.loads(json_files[0].read_text())
+        results_data = _load_results_file(results_dir)
 
         execution = results_data["features"][0]["scenarios"][0]["executions"][0]
         assert "tags" in execution
@@ -563,12 +570,11 @@ tags: []
             def test_no_tags():
                 pass
             """)
-        result = pytester.runpytest("-v")
+        result = pytester.runpytest()
         result.assert_outcomes(passed=1)
 
         results_dir = pytester.path / ".specleft" / "results"
-        json_files = list(results_dir.glob("results_*.json"))
-        results_data = json.loads(json_files[0].read_text())
+        results_data = _load_results_file(results_dir)
 
         # Find the notags feature
         notags_feature = next(
@@ -582,13 +588,9 @@ tags: []
 class TestFilterBehavior:
     """Tests for SpecLeft filter handling."""
 
+    @pytest.mark.usefixtures("no_specs_tree")
     def test_filters_skip_without_specs(self, pytester: Pytester) -> None:
         """Test that filters skip tests when specs are missing."""
-        features_dir = pytester.path / ".specleft" / "specs"
-        if features_dir.exists():
-            for path in features_dir.rglob("*"):
-                if path.is_file():
-                    path.unlink()
         pytester.makepyfile("""
             from specleft import specleft
 
@@ -596,7 +598,7 @@ class TestFilterBehavior:
             def test_filtered():
                 pass
             """)
-        result = pytester.runpytest("-v", "--specleft-tag", "smoke")
+        result = pytester.runpytest("--specleft-tag", "smoke")
         result.assert_outcomes(skipped=1)
 
     def test_filters_skip_when_tag_missing(
@@ -610,7 +612,7 @@ class TestFilterBehavior:
             def test_filtered():
                 pass
             """)
-        result = pytester.runpytest("-v", "--specleft-tag", "missing")
+        result = pytester.runpytest("--specleft-tag", "missing")
         result.assert_outcomes(skipped=1)
 
     def test_filters_allow_matching_priority(
@@ -624,7 +626,7 @@ class TestFilterBehavior:
             def test_high():
                 pass
             """)
-        result = pytester.runpytest("-v", "--specleft-priority", "high")
+        result = pytester.runpytest("--specleft-priority", "high")
         result.assert_outcomes(passed=1)
 
     def test_filters_skip_unknown_scenario(
@@ -638,7 +640,7 @@ class TestFilterBehavior:
             def test_unknown():
                 pass
             """)
-        result = pytester.runpytest("-v")
+        result = pytester.runpytest()
         result.assert_outcomes(skipped=1)
 
     def test_load_specs_config_uses_rootpath(self, pytester: Pytester) -> None:
@@ -667,12 +669,6 @@ scenario_id: login-success
 
 # Scenario: Login Success
 """.strip())
-        pytester.makepyfile("""
-            from specleft import specleft
-
-            @specleft(feature_id="auth", scenario_id="login-success")
-            def test_login():
-                pass
-            """)
-        result = pytester.runpytest("-v")
+        pytester.makepyfile(_LOGIN_SUCCESS_TEST)
+        result = pytester.runpytest()
         result.assert_outcomes(passed=1)
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import importlib
+from enum import Enum
 from pathlib import Path
+from typing import Any
 
 import pytest
 import specleft.schema as schema
@@ -20,92 +22,112 @@ from specleft.schema import (
     StorySpec,
 )
 
+from tests.helpers.filesystem import materialize
+
+
+@pytest.fixture(scope="module")
+def sample_config() -> SpecsConfig:
+    """Build a two-feature config once for the read-only lookup tests.
+
+    feature-1 holds scenario-1 (smoke, fast), scenario-2 (regression) and,
+    in a second story, scenario-3 (fast); feature-2 holds deep-target (smoke).
+    """
+    story_1 = StorySpec(
+        story_id="story-1",
+        name="Story 1",
+        scenarios=[
+            ScenarioSpec(
+                scenario_id="scenario-1", name="Scenario 1", tags=["smoke", "fast"]
+            ),
+            ScenarioSpec(
+                scenario_id="scenario-2", name="Scenario 2", tags=["regression"]
+            ),
+        ],
+    )
+    story_2 = StorySpec(
+        story_id="story-2",
+        name="Story 2",
+        scenarios=[
+            ScenarioSpec(scenario_id="scenario-3", name="Scenario 3", tags=["fast"])
+        ],
+    )
+    story_3 = StorySpec(
+        story_id="story-3",
+        name="Story 3",
+        scenarios=[
+            ScenarioSpec(scenario_id="deep-target", name="Deep Target", tags=["smoke"])
+        ],
+    )
+    return SpecsConfig(
+        features=[
+            FeatureSpec(
+                feature_id="feature-1", name="Feature 1", stories=[story_1, story_2]
+            ),
+            FeatureSpec(feature_id="feature-2", name="Feature 2", stories=[story_3]),
+        ]
+    )
+
+
+_ENUM_MEMBERS = pytest.mark.parametrize(
+    ("enum_cls", "members"),
+    [
+        (
+            StepType,
+            {
+                "GIVEN": "given",
+                "WHEN": "when",
+                "THEN": "then",
+                "AND": "and",
+                "BUT": "but",
+            },
+        ),
+        (
+            Priority,
+            {
+                "CRITICAL": "critical",
+                "HIGH": "high",
+                "MEDIUM": "medium",
+                "LOW": "low",
+            },
+        ),
+        (
+            ExecutionTime,
+            {"FAST": "fast", "MEDIUM": "medium", "SLOW": "slow"},
+        ),
+    ],
+    ids=["StepType", "Priority", "ExecutionTime"],
+)
 
-class TestStepType:
-    """Tests for StepType enum."""
-
-    def test_step_type_values(self) -> None:
-        """Test that all BDD step types are defined."""
-        assert StepType.GIVEN.value == "given"
-        assert StepType.WHEN.value == "when"
-        assert StepType.THEN.value == "then"
-        assert StepType.AND.value == "and"
-        assert StepType.BUT.value == "but"
-
-    def test_step_type_from_string(self) -> None:
-        """Test creating StepType from string value."""
-        assert StepType("given") == StepType.GIVEN
-        assert StepType("when") == StepType.WHEN
-        assert StepType("then") == StepType.THEN
-        assert StepType("and") == StepType.AND
-        assert StepType("but") == StepType.BUT
-
-    def test_step_type_is_string_enum(self) -> None:
-        """Test that StepType is a str enum."""
-        assert isinstance(StepType.GIVEN, str)
-        assert StepType.GIVEN.value == "given"
-        assert StepType.GIVEN.name == "GIVEN"
-
-    def test_step_type_invalid_value(self) -> None:
-        """Test that invalid step type raises ValueError."""
-        with pytest.raises(ValueError):
-            StepType("invalid")
-
-
-class TestPriority:
-    """Tests for Priority enum."""
-
-    def test_priority_values(self) -> None:
-        """Test that all priority levels are defined."""
-        assert Priority.CRITICAL.value == "critical"
-        assert Priority.HIGH.value == "high"
-        assert Priority.MEDIUM.value == "medium"
-        assert Priority.LOW.value == "low"
-
-    def test_priority_from_string(self) -> None:
-        """Test creating Priority from string value."""
-        assert Priority("critical") == Priority.CRITICAL
-        assert Priority("high") == Priority.HIGH
-        assert Priority("medium") == Priority.MEDIUM
-        assert Priority("low") == Priority.LOW
-
-    def test_priority_is_string_enum(self) -> None:
-        """Test that Priority is a str enum."""
-        assert isinstance(Priority.HIGH, str)
-        assert Priority.HIGH.value == "high"
-        assert Priority.HIGH.name == "HIGH"
-
-    def test_priority_invalid_value(self) -> None:
-        """Test that invalid priority raises ValueError."""
-        with pytest.raises(ValueError):
-            Priority("invalid")
-
-
-class TestExecutionTime:
-    """Tests for ExecutionTime enum."""
-
-    def test_execution_time_values(self) -> None:
-        """Test that all execution time levels are defined."""
-        assert ExecutionTime.FAST.value == "fast"
-        assert ExecutionTime.MEDIUM.value == "medium"
-        assert ExecutionTime.SLOW.value == "slow"
-
-    def test_execution_time_from_string(self) -> None:
-        """Test creating ExecutionTime from string value."""
-        assert ExecutionTime("fast") == ExecutionTime.FAST
-        assert ExecutionTime("medium") == ExecutionTime.MEDIUM
-        assert ExecutionTime("slow") == ExecutionTime.SLOW
-
-    def test_execution_time_is_string_enum(self) -> None:
-        """Test that ExecutionTime is a str enum."""
-        assert isinstance(ExecutionTime.FAST, str)
-        assert ExecutionTime.FAST.value == "fast"
-        assert ExecutionTime.FAST.name == "FAST"
 
-    def test_execution_time_invalid_value(self) -> None:
-        """Test that invalid execution time raises ValueError."""
+class TestStringEnums:
+    """Tests for the StepType, Priority and ExecutionTime str enums."""
+
+    @_ENUM_MEMBERS
+    def test_values(self, enum_cls: type[Enum], members: dict[str, str]) -> None:
+        """Test that every member is defined with its string value."""
+        assert {member.name: member.value for member in enum_cls} == members
+
+    @_ENUM_MEMBERS
+    def test_from_string(self, enum_cls: type[Enum], members: dict[str, str]) -> None:
+        """Test creating each member from its string value."""
+        for name, value in members.items():
+            assert enum_cls(value) is enum_cls[name]
+
+    @_ENUM_MEMBERS
+    def test_is_string_enum(
+        self, enum_cls: type[Enum], members: dict[str, str]
+    ) -> None:
+        """Test that members are str instances equal to their values."""
+        for name, value in members.items():
+            member = enum_cls[name]
+            assert isinstance(member, str)
+            assert member == value
+
+    @_ENUM_MEMBERS
+    def test_invalid_value(self, enum_cls: type[Enum], members: dict[str, str]) -> None:
+        """Test that an unknown value raises ValueError."""
         with pytest.raises(ValueError):
-            ExecutionTime("invalid")
+            enum_cls("invalid")
 
 
 class TestSpecStep:
@@ -147,11 +169,11 @@ class TestSpecStep:
         step = SpecStep(type=StepType.GIVEN, description="   ")
         assert step.description == ""
 
-    def test_step_with_all_step_types(self) -> None:
-        """Test creating steps with all step types."""
-        for step_type in StepType:
-            step = SpecStep(type=step_type, description="test step")
-            assert step.type == step_type
+    @pytest.mark.parametrize("step_type", list(StepType), ids=lambda s: s.name)
+    def test_step_accepts_type(self, step_type: StepType) -> None:
+        """Test creating steps with each step type."""
+        step = SpecStep(type=step_type, description="test step")
+        assert step.type == step_type
 
     def test_step_with_string_type(self) -> None:
         """Test creating step with string type value."""
@@ -189,24 +211,16 @@ class TestSpecDataRow:
             SpecDataRow(params={})
         assert "Test data params cannot be empty" in str(exc_info.value)
 
-    def test_data_row_params_with_various_types(self) -> None:
+    @pytest.mark.parametrize(
+        "value",
+        ["value", 42, 3.14, True, [1, 2, 3], {"nested": "value"}],
+        ids=["string", "number", "float", "boolean", "list", "dict"],
+    )
+    def test_data_row_params_with_various_types(self, value: Any) -> None:
         """Test that params can contain various types."""
-        row = SpecDataRow(
-            params={
-                "string": "value",
-                "number": 42,
-                "float": 3.14,
-                "boolean": True,
-                "list": [1, 2, 3],
-                "dict": {"nested": "value"},
-            }
-        )
-        assert row.params["string"] == "value"
-        assert row.params["number"] == 42
-        assert row.params["float"] == 3.14
-        assert row.params["boolean"] is True
-        assert row.params["list"] == [1, 2, 3]
-        assert row.params["dict"] == {"nested": "value"}
+        row = SpecDataRow(params={"key": value})
+        assert row.params["key"] == value
+        assert type(row.params["key"]) is type(value)
 
 
 class TestScenarioSpec:
@@ -532,25 +546,19 @@ class TestSpecsConfig:
         feature = FeatureSpec(feature_id="feature", name="Feature", stories=[story])
         config = SpecsConfig(features=[feature])
         assert len(config.features) == 1
+        assert config.features[0].all_scenarios == scenarios
+        for scenario in scenarios:
+            assert config.get_scenario(scenario.scenario_id) is scenario
 
-    def test_get_scenario_found(self) -> None:
+    def test_get_scenario_found(self, sample_config: SpecsConfig) -> None:
         """Test lookup by scenario ID when found."""
-        scenario = ScenarioSpec(scenario_id="target", name="Target Scenario")
-        story = StorySpec(story_id="story", name="Story", scenarios=[scenario])
-        feature = FeatureSpec(feature_id="feature", name="Feature", stories=[story])
-        config = SpecsConfig(features=[feature])
-
-        result = config.get_scenario("target")
-        assert result == scenario
+        result = sample_config.get_scenario("scenario-1")
+        assert result is not None
+        assert result is sample_config.features[0].stories[0].scenarios[0]
 
-    def test_get_scenario_not_found(self) -> None:
+    def test_get_scenario_not_found(self, sample_config: SpecsConfig) -> None:
         """Test lookup by scenario ID when not found."""
-        scenario = ScenarioSpec(scenario_id="existing", name="Existing")
-        story = StorySpec(story_id="story", name="Story", scenarios=[scenario])
-        feature = FeatureSpec(feature_id="feature", name="Feature", stories=[story])
-        config = SpecsConfig(features=[feature])
-
-        result = config.get_scenario("missing")
+        result = sample_config.get_scenario("missing")
         assert result is None
 
     def test_get_scenario_empty_config(self) -> None:
@@ -559,61 +567,23 @@ class TestSpecsConfig:
         result = config.get_scenario("any")
         assert result is None
 
-    def test_get_scenario_nested_deep(self) -> None:
+    def test_get_scenario_nested_deep(self, sample_config: SpecsConfig) -> None:
         """Test lookup finds scenario in nested structure."""
-        target = ScenarioSpec(scenario_id="deep-target", name="Deep Target")
-        other_scenario = ScenarioSpec(scenario_id="other", name="Other")
-
-        story1 = StorySpec(
-            story_id="story-1", name="Story 1", scenarios=[other_scenario]
-        )
-        story2 = StorySpec(story_id="story-2", name="Story 2", scenarios=[target])
-
-        feature1 = FeatureSpec(
-            feature_id="feature-1", name="Feature 1", stories=[story1]
-        )
-        feature2 = FeatureSpec(
-            feature_id="feature-2", name="Feature 2", stories=[story2]
-        )
-
-        config = SpecsConfig(features=[feature1, feature2])
-
-        result = config.get_scenario("deep-target")
-        assert result == target
+        result = sample_config.get_scenario("deep-target")
+        assert result is not None
+        assert result is sample_config.features[1].stories[0].scenarios[0]
 
-    def test_get_scenarios_by_tag_found(self) -> None:
+    def test_get_scenarios_by_tag_found(self, sample_config: SpecsConfig) -> None:
         """Test filtering by tag when matches exist."""
-        scenario1 = ScenarioSpec(
-            scenario_id="scenario-1", name="Scenario 1", tags=["smoke", "fast"]
-        )
-        scenario2 = ScenarioSpec(
-            scenario_id="scenario-2", name="Scenario 2", tags=["regression"]
-        )
-        scenario3 = ScenarioSpec(
-            scenario_id="scenario-3", name="Scenario 3", tags=["smoke"]
-        )
-
-        story = StorySpec(
-            story_id="story",
-            name="Story",
-            scenarios=[scenario1, scenario2, scenario3],
-        )
-        feature = FeatureSpec(feature_id="feature", name="Feature", stories=[story])
-        config = SpecsConfig(features=[feature])
-
-        result = config.get_scenarios_by_tag("smoke")
-        assert result == [scenario1, scenario3]
+        result = sample_config.get_scenarios_by_tag("fast")
+        assert [scenario.scenario_id for scenario in result] == [
+            "scenario-1",
+            "scenario-3",
+        ]
 
-    def test_get_scenarios_by_tag_not_found(self) -> None:
+    def test_get_scenarios_by_tag_not_found(self, sample_config: SpecsConfig) -> None:
         """Test filtering by tag when no matches."""
-        scenario = ScenarioSpec(
-            scenario_id="scenario", name="Scenario", tags=["regression"]
-        )
-        story = StorySpec(story_id="story", name="Story", scenarios=[scenario])
-        feature = FeatureSpec(feature_id="feature", name="Feature", stories=[story])
-        config = SpecsConfig(features=[feature])
-
-        result = config.get_scenarios_by_tag("smoke")
+        result = sample_config.get_scenarios_by_tag("nightly")
         assert result == []
 
     def test_get_scenarios_by_tag_empty_config(self) -> None:
@@ -622,55 +592,36 @@ class TestSpecsConfig:
         result = config.get_scenarios_by_tag("any")
         assert result == []
 
-    def test_get_scenarios_by_tag_across_features(self) -> None:
+    def test_get_scenarios_by_tag_across_features(
+        self, sample_config: SpecsConfig
+    ) -> None:
         """Test filtering by tag across multiple features."""
-        scenario1 = ScenarioSpec(
-            scenario_id="scenario-1", name="Scenario 1", tags=["critical"]
-        )
-        scenario2 = ScenarioSpec(
-            scenario_id="scenario-2", name="Scenario 2", tags=["critical"]
-        )
-
-        story1 = StorySpec(story_id="story-1", name="Story 1", scenarios=[scenario1])
-        story2 = StorySpec(story_id="story-2", name="Story 2", scenarios=[scenario2])
-
-        feature1 = FeatureSpec(
-            feature_id="feature-1", name="Feature 1", stories=[story1]
-        )
-        feature2 = FeatureSpec(
-            feature_id="feature-2", name="Feature 2", stories=[story2]
-        )
-
-        config = SpecsConfig(features=[feature1, feature2])
-
-        result = config.get_scenarios_by_tag("critical")
-        assert result == [scenario1, scenario2]
+        result = sample_config.get_scenarios_by_tag("smoke")
+        assert [scenario.scenario_id for scenario in result] == [
+            "scenario-1",
+            "deep-target",
+        ]
 
     def test_from_directory(self, tmp_path: Path) -> None:
         """Test loading config from directory."""
-        # Create a minimal feature structure
-        feature_dir = tmp_path / "test-feature"
-        feature_dir.mkdir()
-
-        # Create _feature.md
-        feature_md = feature_dir / "_feature.md"
-        feature_md.write_text("# Feature: test-feature\n\nTest feature description\n")
-
-        # Create story directory with _story.md
-        story_dir = feature_dir / "test-story"
-        story_dir.mkdir()
-        story_md = story_dir / "_story.md"
-        story_md.write_text("# Story: test-story\n\nTest story description\n")
-
-        # Create scenario file
-        scenario_md = story_dir / "test-scenario.md"
-        scenario_md.write_text(
-            "# Scenario: test-scenario\n\n"
-            "Test scenario description\n\n"
-            "## Steps\n\n"
-            "- Given a precondition\n"
-            "- When an action occurs\n"
-            "- Then a result is expected\n"
+        materialize(
+            tmp_path,
+            {
+                "test-feature/_feature.md": (
+                    "# Feature: test-feature\n\nTest feature description\n"
+                ),
+                "test-feature/test-story/_story.md": (
+                    "# Story: test-story\n\nTest story description\n"
+                ),
+                "test-feature/test-story/test-scenario.md": (
+                    "# Scenario: test-scenario\n\n"
+                    "Test scenario description\n\n"
+                    "## Steps\n\n"
+                    "- Given a precondition\n"
+                    "- When an action occurs\n"
+                    "- Then a result is expected\n"
+                ),
+            },
         )
 
         # Load from directory